@@ -1,13 +1,28 @@
 import os
+import sys
+import hmac
 import json
-from flask import Flask, jsonify, abort
+import time
+import struct
+import threading
+from collections.abc import Sequence
+from flask import Flask, Response, jsonify, abort, g, request
 from flask_cors import CORS  # ✅ Import CORS
 
+import compression
+import metrics
+from compression import BodyCache
+from dedup import article_id, content_fingerprint, duplicate_groups, group_categories
+from packfile import ArticleRef, PackedArticles, pack_path
+from records import Article, compact, deep_size
+from snapshots import SnapshotStore
+from store import ArticleStore, source_of
+
 app = Flask(__name__)
-CORS(app)  # ✅ Enable CORS for all routes
+CORS(app, expose_headers=["X-Total-Count"])  # ✅ Enable CORS for all routes (and let pagers read the total)
 
-# Path to data folder inside backend
-DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+# Path to data folder inside backend (overridable, e.g. to serve a benchmark's output)
+DATA_DIR = os.environ.get("AZERNEWS_DATA_DIR", os.path.join(os.path.dirname(__file__), "data"))
 
 # Category to JSON filename mapping
 CATEGORIES = {
@@ -19,19 +34,296 @@ CATEGORIES = {
     "culture": "azernews_culture.json"
 }
 
+# Published data versions; the live one is read from snapshots.current_dir()
+snapshots = SnapshotStore(DATA_DIR)
+
+# "auto" loads a category's packfile (mapped, decoded lazily) when the
+# version has one and its JSON file otherwise; "json" always uses JSON
+DATA_FORMAT = os.environ.get("AZERNEWS_DATA_FORMAT", "auto")
+
+# Bytes of serialized bodies and their compressed variants cached per
+# snapshot (and per worker); paging and projection parameters vary freely,
+# so the cache is capped by size rather than kept for every variant
+MAX_CACHED_BYTES = int(os.environ.get("AZERNEWS_RESPONSE_CACHE_BYTES", str(64 * 2**20)))
+
+def data_file(category, directory):
+    json_path = os.path.join(directory, CATEGORIES[category])
+    if DATA_FORMAT != "json" and os.path.exists(pack_path(json_path)):
+        return pack_path(json_path)
+    return json_path
+
+# Files carried into a new version are hard links, so an unchanged
+# category keeps its mtime across versions and is not reloaded
+def data_file_mtime(category, directory):
+    try:
+        return os.stat(data_file(category, directory)).st_mtime_ns
+    except OSError:
+        return None
+
+# Articles are held as compact records.Article objects (slots, interned
+# authors and image directories, content as one string), not dicts
+def load_category(category, directory):
+    file_path = data_file(category, directory)
+    if not os.path.exists(file_path):
+        return []
+    if file_path.endswith(".pack"):
+        try:
+            return PackedArticles(file_path, record=Article)
+        except (ValueError, TypeError, struct.error, OSError, RuntimeError) as e:
+            # A damaged pack must not take the API down; its JSON twin has the same articles
+            print(f"❌ Unreadable pack {file_path}, loading the JSON file instead: {e}")
+            file_path = os.path.join(directory, CATEGORIES[category])
+            if not os.path.exists(file_path):
+                return []
+    with open(file_path, "r", encoding="utf-8") as f:
+        try:
+            articles = json.load(f)
+        except json.JSONDecodeError:
+            return []
+    for article in articles:
+        article["id"] = article_id(article.get("link"))
+    return compact(articles)
+
+def article_refs(articles):
+    """ID, link and fingerprint per article; read from a pack's index without decoding."""
+    if isinstance(articles, PackedArticles):
+        return articles.refs
+    return [ArticleRef(a["id"], a.get("link"), content_fingerprint(a)) for a in articles]
+
+class UniqueArticles(Sequence):
+    """Each article once, with all its categories, built from (category, position, categories) entries."""
+
+    def __init__(self, articles, entries):
+        self.articles = articles
+        self.entries = entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        category, position, categories = self.entries[index]
+        return {**self.articles[category][position], "categories": categories}
+
+class DataSnapshot:
+    """One consistent, never-mutated version of the loaded data.
+
+    Reloads build a new snapshot and swap the module-level reference in
+    one assignment, so a request that grabbed `data` keeps a complete view
+    even while a reload is running.
+    """
+
+    def __init__(self, articles, mtimes, version=None):
+        self.articles = articles
+        self.mtimes = mtimes
+        self.version = version
+        # Each article once, with every category it is listed under; matched
+        # by ID or content fingerprint. Built from the article refs alone, so
+        # packed categories stay undecoded until an article is requested.
+        refs = {category: [(position, ref) for position, ref in enumerate(article_refs(category_articles))]
+                for category, category_articles in articles.items()}
+        entries = []
+        # article ID -> index into self.unique
+        self.by_id = {}
+        for group in duplicate_groups(refs, key=lambda item: item[1].id, fingerprint=lambda item: item[1].fingerprint):
+            category, (position, _) = group[0]
+            entries.append((category, position, group_categories(group)))
+            for _, (_, ref) in group:
+                self.by_id.setdefault(ref.id, len(entries) - 1)
+        self.unique = UniqueArticles(articles, entries)
+        # Serialized JSON bodies (CachedBody, with their compressed variants),
+        # keyed by category ("*" for all) plus the paging/projection parameters
+        self.responses = BodyCache(MAX_CACHED_BYTES)
+
+def sync_store(category, articles, directory, force=False):
+    """Bring the store's copy of a category in line with the data file it was loaded from.
+
+    crawl.save_results syncs the categories it publishes, so this only
+    does work when the store lags the files: a new or copied database, a
+    rollback, JSON files written by hand, or a forced reload.
+    """
+    source = source_of(os.path.join(directory, CATEGORIES[category]))
+    if source is None or (not force and store.synced_source(category) == source):
+        return
+    read = articles.read if isinstance(articles, PackedArticles) else articles.__getitem__
+    try:
+        store.sync_category(category, (read(i) for i in range(len(articles))), source)
+    except Exception as e:
+        # Search falls behind, but the articles themselves are still served
+        print(f"❌ Could not sync {category} into the store: {e}")
+
+def build_snapshot(previous=None, force=False):
+    """Load changed data files, reusing unchanged categories from `previous` (copy-on-write).
+
+    The live version is resolved once, so every category comes from the same one.
+    """
+    version = snapshots.current_version()
+    directory = snapshots.version_dir(version)
+    articles = {}
+    mtimes = {}
+    for category in CATEGORIES:
+        mtimes[category] = data_file_mtime(category, directory)
+        if previous and previous.mtimes.get(category) == mtimes[category]:
+            articles[category] = previous.articles[category]
+        else:
+            articles[category] = load_category(category, directory)
+            sync_store(category, articles[category], directory, force)
+    return DataSnapshot(articles, mtimes, version)
+
+# Indexed copy of the same articles (scrapers also write to it directly)
+store = ArticleStore(os.path.join(DATA_DIR, "azernews.db"))
+
 # Load all articles on startup into memory
-articles_by_category = {}
-
-for category, filename in CATEGORIES.items():
-    file_path = os.path.join(DATA_DIR, filename)
-    if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            try:
-                articles_by_category[category] = json.load(f)
-            except json.JSONDecodeError:
-                articles_by_category[category] = []
-    else:
-        articles_by_category[category] = []
+data = build_snapshot()
+articles_by_category = data.articles
+
+_reload_lock = threading.Lock()
+
+def reload_data(force=False):
+    """Swap in a new snapshot if the live version or any data file changed; returns True if it did."""
+    global data, articles_by_category
+    with _reload_lock:
+        current = data
+        version = snapshots.current_version()
+        directory = snapshots.version_dir(version)
+        if (not force and version == current.version
+                and all(data_file_mtime(c, directory) == current.mtimes[c] for c in CATEGORIES)):
+            return False
+        snapshot = build_snapshot(None if force else current, force)
+        data, articles_by_category = snapshot, snapshot.articles
+        return True
+
+def watch_data_files(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            reload_data()
+        except Exception as e:
+            print(f"❌ Error reloading data: {e}")
+
+# Seconds between data file checks; 0 disables the watcher (use /api/reload)
+RELOAD_INTERVAL = float(os.environ.get("AZERNEWS_RELOAD_INTERVAL", "5"))
+
+# Seconds between scrapes run by this process; 0 (default) leaves scraping to
+# scripts/scheduler.py or cron. Published categories are swapped in right away.
+SCRAPE_INTERVAL = float(os.environ.get("AZERNEWS_SCRAPE_INTERVAL", "0"))
+
+def start_background_tasks(scheduler=True):
+    """Start the data file watcher and, when SCRAPE_INTERVAL is set, the scrape scheduler."""
+    if RELOAD_INTERVAL > 0:
+        threading.Thread(target=watch_data_files, args=(RELOAD_INTERVAL,), daemon=True).start()
+    if scheduler and SCRAPE_INTERVAL > 0:
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+        from scheduler import Scheduler
+        Scheduler.every(SCRAPE_INTERVAL, data_dir=DATA_DIR, on_publish=lambda categories: reload_data()).start()
+
+# A pre-forking server (gunicorn.conf.py) imports the app once in its master
+# and sets AZERNEWS_PRELOAD; threads don't survive a fork, so it starts the
+# watcher in each worker itself and runs the scheduler as its own process.
+# Under `python app.py` the debug reloader runs this file twice: the serving
+# child (WERKZEUG_RUN_MAIN set) and a parent that only watches the sources,
+# which gets no scheduler of its own.
+if os.environ.get("AZERNEWS_PRELOAD") != "1":
+    start_background_tasks(scheduler=__name__ != "__main__" or os.environ.get("WERKZEUG_RUN_MAIN") == "true")
+
+def cached_json(snapshot, key, build):
+    """Serve pre-serialized JSON with a strong ETag, answering If-None-Match with 304.
+
+    The body is gzip/brotli compressed per Accept-Encoding, at most once per
+    snapshot and encoding (see compression.CachedBody). Once the snapshot's
+    cache budget is spent, new bodies are served like any uncached response.
+    """
+    entry = snapshot.responses.get(key)
+    metrics.api_response_cache.inc(result="miss" if entry is None else "hit")
+    if entry is None:
+        body = app.json.dumps(build()).encode("utf-8")
+        entry = snapshot.responses.add(key, body)
+        if entry is None:
+            # compress_response compresses it at the fast levels
+            return Response(body, mimetype="application/json")
+    encoding = compression.choose_encoding(request.accept_encodings, len(entry.body))
+    body, etag = entry.variant(encoding)
+    response = Response(body, mimetype="application/json")
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+@app.before_request
+def start_timer():
+    g.started = time.perf_counter()
+
+# Registered before compress_response, so it runs after it and sees the bytes actually sent
+@app.after_request
+def record_request(response):
+    route = request.url_rule.rule if request.url_rule else "<unmatched>"
+    metrics.api_request_seconds.observe(time.perf_counter() - g.started, route=route, method=request.method,
+                                        status=response.status_code)
+    if not response.is_streamed:
+        metrics.api_response_bytes.observe(response.content_length or 0, route=route)
+    return response
+
+@app.after_request
+def compress_response(response):
+    """Compress the uncached JSON responses (search, author filter, bodies past the cache budget) on the fly."""
+    if (response.mimetype != "application/json" or response.is_streamed or response.direct_passthrough
+            or "Content-Encoding" in response.headers or response.status_code != 200):
+        return response
+    body = response.get_data()
+    encoding = compression.choose_encoding(request.accept_encodings, len(body))
+    response.vary.add("Accept-Encoding")
+    if encoding:
+        response.set_data(compression.compress(body, encoding, fast=True)[0])
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+def page_args():
+    """Read ?limit=&offset=&fields= (fields is a comma-separated projection)."""
+    limit = request.args.get("limit", type=int)
+    offset = max(request.args.get("offset", default=0, type=int), 0)
+    fields = request.args.get("fields")
+    fields = tuple(f.strip() for f in fields.split(",") if f.strip()) if fields else None
+    if limit is not None and limit < 0:
+        abort(400, description="limit must be >= 0")
+    return limit, offset, fields
+
+# Length of the "preview" field: the start of the first paragraph, for cards
+PREVIEW_LENGTH = 200
+
+# Fields computed from the content, so list views can skip fetching it
+COMPUTED_FIELDS = {
+    "preview": lambda article: (article.get("content") or [""])[0][:PREVIEW_LENGTH],
+    "words": lambda article: len(" ".join(article.get("content") or []).split()),
+}
+
+def project(article, fields):
+    if fields:
+        projected = {"id": article["id"]}
+        for f in fields:
+            if f in COMPUTED_FIELDS:
+                projected[f] = COMPUTED_FIELDS[f](article)
+            elif f in article:
+                projected[f] = article[f]
+        return projected
+    # Records are read-only Mappings; the JSON encoder wants plain dicts
+    return dict(article)
+
+def page(articles, limit, offset, fields):
+    end = None if limit is None else offset + limit
+    return [project(article, fields) for article in articles[offset:end]]
+
+def stream_ndjson(articles, limit, offset, fields):
+    """One JSON document per line, each article read and serialized only as the client reads.
+
+    Packed articles are decoded without being cached, so streaming a whole
+    archive keeps memory flat.
+    """
+    read = articles.read if isinstance(articles, PackedArticles) else articles.__getitem__
+    end = len(articles) if limit is None else min(len(articles), offset + limit)
+    for position in range(offset, end):
+        yield app.json.dumps(project(read(position), fields)) + "\n"
 
 # Get articles from a specific category
 @app.route("/api/articles/<category>")
@@ -40,18 +332,141 @@ def get_articles_by_category(category):
     if category not in CATEGORIES:
         abort(404, description=f"No data found for category: {category}")
 
-    file_path = os.path.join(DATA_DIR, CATEGORIES[category])
-    if not os.path.exists(file_path):
-        abort(404, description="File not found")
+    # ?q= full-text search and ?author= filter are answered from the store's indexes
+    query = request.args.get("q")
+    if query:
+        return search_response(query, category)
+    author = request.args.get("author")
+    if author:
+        return jsonify(store.category_articles(category, author=author))
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        articles = json.load(f)
-    return jsonify(articles)
+    snapshot = data
+    if snapshot.mtimes[category] is None:
+        abort(404, description="File not found")
+    args = page_args()
+    articles = snapshot.articles[category]
+    if request.args.get("format") == "ndjson":
+        return Response(stream_ndjson(articles, *args), mimetype="application/x-ndjson",
+                        headers={"X-Total-Count": str(len(articles))})
+    response = cached_json(snapshot, (category,) + args, lambda: page(articles, *args))
+    response.headers["X-Total-Count"] = str(len(articles))
+    return response
 
-# Get all categories' articles
+# Get all categories' articles (limit/offset/fields apply per category);
+# ?unique=1 returns one flat list with each article once instead
 @app.route("/api/articles")
 def get_all_articles():
-    return jsonify(articles_by_category)
+    snapshot = data
+    args = page_args()
+    if request.args.get("unique") == "1":
+        response = cached_json(snapshot, ("unique",) + args, lambda: page(snapshot.unique, *args))
+        response.headers["X-Total-Count"] = str(len(snapshot.unique))
+        return response
+    return cached_json(snapshot, ("*",) + args, lambda: {
+        category: page(articles, *args) for category, articles in snapshot.articles.items()
+    })
+
+def search_response(query, category=None):
+    limit = min(max(request.args.get("limit", default=20, type=int), 1), 100)
+    results = store.search(query, category=category, limit=limit)
+    for article in results:
+        article["id"] = article_id(article["link"])
+    return jsonify(results)
+
+# Ranked full-text search (BM25 over title, summary and content)
+@app.route("/api/search")
+def search():
+    query = request.args.get("q", "")
+    category = request.args.get("category")
+    if category and category.lower() not in CATEGORIES:
+        abort(404, description=f"No data found for category: {category}")
+    return search_response(query, category.lower() if category else None)
+
+# Get one article by its stable ID
+@app.route("/api/article/<article_id>")
+def get_article(article_id):
+    snapshot = data
+    found = snapshot.by_id.get(article_id)
+    if found is None:
+        abort(404, description=f"No article with id: {article_id}")
+    article = snapshot.unique[found]
+    return cached_json(snapshot, ("article", article_id), lambda: {**article, "category": article["categories"][0]})
+
+# Compression ratio and CPU time spent vs. saved by the precompressed cache
+@app.route("/api/stats")
+def get_stats():
+    return jsonify({"compression": compression.stats.summary(), "encodings": list(compression.ENCODINGS)})
+
+# Compression counters as Prometheus metrics, read at scrape time
+for _name, _help in (("bytes_in", "Bytes before compression"), ("bytes_out", "Bytes after compression"),
+                     ("cpu_seconds", "CPU seconds spent compressing"),
+                     ("cpu_saved_seconds", "CPU seconds saved by reusing compressed bodies")):
+    metrics.Gauge(f"azernews_api_compression_{_name}", _help, lambda name=_name: getattr(compression.stats, name))
+metrics.Gauge("azernews_api_compression_ratio", "Uncompressed / compressed bytes",
+              lambda: compression.stats.summary()["ratio"])
+
+# Prometheus scrape endpoint: API latency, payload sizes, cache hit ratios and,
+# when the scheduler runs in this process, the scraper stages
+@app.route("/metrics")
+def get_metrics():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+# Required as "Authorization: Bearer <token>" by the admin endpoints. Without
+# it they only answer requests from this machine; behind a reverse proxy on
+# the same host every request comes from loopback, so set a token there.
+ADMIN_TOKEN = os.environ.get("AZERNEWS_ADMIN_TOKEN")
+
+def require_admin():
+    """Abort with 403 unless the request may use the admin endpoints."""
+    if ADMIN_TOKEN:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+            return
+    elif request.remote_addr in ("127.0.0.1", "::1"):
+        return
+    abort(403, description="Admin endpoint: set AZERNEWS_ADMIN_TOKEN and send it as a bearer token")
+
+# This worker's memory: process totals and what the loaded articles take.
+# Each worker answers for itself, so divide the memory budget by "private"
+# to size the worker count. Admin only: walking every loaded article costs
+# seconds of CPU on a large archive.
+@app.route("/api/memory")
+def get_memory():
+    require_admin()
+    snapshot = data
+    categories = {}
+    loaded = []
+    for category, articles in snapshot.articles.items():
+        if isinstance(articles, PackedArticles):
+            decoded = articles.cached()
+            categories[category] = {"articles": len(articles), "decoded": len(decoded),
+                                    "bytes": deep_size(decoded, articles.refs),
+                                    "mapped_bytes": os.path.getsize(articles.path)}
+            loaded.extend((decoded, articles.refs))
+        else:
+            categories[category] = {"articles": len(articles), "bytes": deep_size(articles)}
+            loaded.append(articles)
+    # Shared values (interned strings) count once here, unlike in the per-category sums
+    articles_bytes = deep_size(*loaded)
+    process = metrics.process_memory()
+    return jsonify({
+        "pid": os.getpid(),
+        "process": process,
+        "articles_bytes": articles_bytes,
+        "index_bytes": deep_size(snapshot.by_id, snapshot.unique.entries),
+        "unique_articles": len(snapshot.unique),
+        "categories": categories,
+        "workers_per_gib": (2**30 // process["private"]) if process.get("private") else None,
+    })
+
+# Reload changed data files now instead of waiting for the watcher (admin only:
+# a forced reload re-reads every file and resyncs the store)
+@app.route("/api/reload", methods=["POST"])
+def reload():
+    require_admin()
+    changed = reload_data(force=request.args.get("force") == "1")
+    return jsonify({"reloaded": changed, "version": data.version,
+                    "categories": {c: len(a) for c, a in data.articles.items()}})
 
 # API health check
 @app.route("/")
@@ -60,10 +475,24 @@ def index():
         "message": "✅ Azernews API is running",
         "routes": [
             "/api/articles",
+            "/api/articles?unique=1",
             "/api/articles/<category>",
+            "/api/articles/<category>?limit=<n>&offset=<n>&fields=<a,b>",
+            "/api/articles?unique=1&limit=<n>&fields=title,thumbnail,preview,words",
+            "/api/articles/<category>?format=ndjson",
+            "/api/article/<id>",
+            "/api/search?q=<text>&category=<category>",
+            "/api/articles/<category>?q=<text>",
+            "/api/articles/<category>?author=<name>",
+            "/api/stats",
+            "/metrics",
+            "/api/memory (admin)",
+            "POST /api/reload (admin)",
         ],
         "categories": list(CATEGORIES.keys())
     })
 
+# Development server (one process, debugger on; never expose it). In
+# production run gunicorn -c gunicorn.conf.py app:app, or python serve.py
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,72 @@
+"""Memory held by loaded articles: plain dicts vs. compact records.
+
+Loads N synthetic articles from a JSON file the way the API does, then
+measures them as the dicts json.load returns and as records.Article
+objects (slots, interned authors and image directories, joined content).
+Reports the bytes per article and, for a given per-worker baseline, how
+many API workers fit in a GiB.
+
+    python benchmarks/bench_memory.py [--sizes 10000 100000] [--paragraphs 8] [--baseline-mib 35]
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import tracemalloc
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(BACKEND_DIR, "scripts"))
+sys.path.insert(0, BACKEND_DIR)
+
+import records  # noqa: E402
+from bench_startup import synthetic_articles  # noqa: E402
+from dataset import write_json_array  # noqa: E402
+from dedup import article_id  # noqa: E402
+
+def load_dicts(path):
+    with open(path, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+    for article in articles:
+        article["id"] = article_id(article.get("link"))
+    return articles
+
+def traced(function):
+    """(result, bytes still allocated by the call once it returns)"""
+    tracemalloc.start()
+    result = function()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--paragraphs", type=int, default=8, help="paragraphs per synthetic article")
+    parser.add_argument("--baseline-mib", type=float, default=35,
+                        help="private memory of an API worker with no articles loaded")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".json", delete=False) as f:
+            write_json_array(f, synthetic_articles(size, args.paragraphs))
+        try:
+            dicts, dicts_traced = traced(lambda: load_dicts(f.name))
+            dicts_size = records.deep_size(dicts)
+            del dicts
+            compact, compact_traced = traced(lambda: records.compact(load_dicts(f.name)))
+            compact_size = records.deep_size(compact)
+            del compact
+        finally:
+            os.remove(f.name)
+
+        print(f"\n{size} articles")
+        for name, measured, allocated in (("dicts", dicts_size, dicts_traced),
+                                          ("records", compact_size, compact_traced)):
+            worker = args.baseline_mib * 2**20 + allocated
+            print(f"  {name:<8} {measured / 2**20:8.1f} MiB ({measured / size:6.0f} B/article)  "
+                  f"{allocated / 2**20:8.1f} MiB allocated  {2**30 / worker:5.1f} workers/GiB")
+        print(f"  records take {compact_traced / dicts_traced:.0%} of the dicts' memory")
+
+if __name__ == "__main__":
+    main()
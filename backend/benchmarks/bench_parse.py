@@ -0,0 +1,59 @@
+"""Parse-time and peak-memory comparison for the scraper HTML parsing.
+
+Compares the original full `html.parser` tree with the lxml backend and
+with lxml plus the SoupStrainer used by extract_article_details, on the
+saved pages in fixtures/.
+
+    python benchmarks/bench_parse.py [--repeat N]
+"""
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from parsing import ARTICLE_PARTS  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+STRATEGIES = {
+    "html.parser (old)": lambda html: BeautifulSoup(html, "html.parser"),
+    "lxml full": lambda html: BeautifulSoup(html, "lxml"),
+    "lxml + strainer (new)": lambda html: BeautifulSoup(html, "lxml", parse_only=ARTICLE_PARTS),
+}
+
+def measure(parse, html, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse(html)
+    elapsed = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for name in sorted(os.listdir(FIXTURES_DIR)):
+        if not name.startswith("article_"):
+            continue
+        with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as f:
+            html = f.read()
+        print(f"\n{name} ({len(html) / 1024:.1f} KiB)")
+        baseline = None
+        for label, parse in STRATEGIES.items():
+            elapsed, peak = measure(parse, html, args.repeat)
+            baseline = baseline or elapsed
+            print(f"  {label:<24} {elapsed * 1000:8.2f} ms  {peak / 1024:8.1f} KiB peak  "
+                  f"x{baseline / elapsed:.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Throughput and tail latency of the API under each way of serving it.
+
+Starts the API as the Flask dev server (python app.py), under waitress
+(serve.py) and under gunicorn (gunicorn.conf.py), one at a time on a
+free local port, and load tests each with load_test.py. Servers whose
+package is not installed are skipped.
+
+    python benchmarks/bench_server.py [--servers dev waitress gunicorn] [--path /api/articles ...]
+                                      [--concurrency 16] [--requests 2000] [--data-dir DIR]
+"""
+import os
+import sys
+import time
+import socket
+import argparse
+import subprocess
+import importlib.util
+
+import requests
+
+from load_test import load_test, print_result
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+SERVERS = {
+    # What `python app.py` runs, minus the reloader (it would fork a second server)
+    "dev": lambda port: [sys.executable, "-c",
+                         f"from app import app; app.run(port={port}, debug=True, use_reloader=False)"],
+    "waitress": lambda port: [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(port)],
+    "gunicorn": lambda port: [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "-b", f"127.0.0.1:{port}",
+                              "app:app"],
+}
+REQUIRES = {"dev": "flask", "waitress": "waitress", "gunicorn": "gunicorn"}
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def wait_until_up(base_url, process, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited with status {process.returncode}")
+        try:
+            if requests.get(base_url + "/", timeout=1).ok:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server not up after {timeout}s")
+
+def bench_server(name, paths, concurrency, requests_total, env):
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(SERVERS[name](port), cwd=BACKEND_DIR, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_up(base_url, process)
+        for path in paths:
+            load_test(base_url, path, concurrency, min(requests_total, 50))  # warm the response caches
+        return [load_test(base_url, path, concurrency, requests_total) for path in paths]
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", nargs="+", default=list(SERVERS), choices=list(SERVERS))
+    parser.add_argument("--path", action="append", help="endpoint to test (repeatable; default: /api/articles)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per endpoint")
+    parser.add_argument("--data-dir", help="data dir to serve (default: the API's own)")
+    args = parser.parse_args()
+
+    env = dict(os.environ, AZERNEWS_RELOAD_INTERVAL="0")
+    if args.data_dir:
+        env["AZERNEWS_DATA_DIR"] = os.path.abspath(args.data_dir)
+    paths = args.path or ["/api/articles"]
+    print(f"🚀 {args.concurrency} clients, {args.requests} requests per endpoint, {os.cpu_count()} CPUs")
+    for name in args.servers:
+        if importlib.util.find_spec(REQUIRES[name]) is None:
+            print(f"⏭️ {name}: {REQUIRES[name]} is not installed")
+            continue
+        print(f"\n📊 {name}")
+        try:
+            for result in bench_server(name, paths, args.concurrency, args.requests, env):
+                print_result(result)
+        except RuntimeError as e:
+            print(f"❌ {name}: {e}")
+
+if __name__ == "__main__":
+    main()
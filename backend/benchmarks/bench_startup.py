@@ -0,0 +1,109 @@
+"""API cold-start cost of the JSON data files vs. the binary packfiles.
+
+Writes N synthetic articles as a pretty-printed JSON file (as the scrapers
+do) and as packfiles, then times what the API does for one category at
+startup: app.load_category plus reading the IDs and fingerprints that
+DataSnapshot needs. Also times decoding the first article and all of
+them, and reports the peak memory of the load.
+
+    python benchmarks/bench_startup.py [--sizes 10000 100000] [--paragraphs 8]
+"""
+import os
+import sys
+import time
+import shutil
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(BACKEND_DIR, "scripts"))
+sys.path.insert(0, BACKEND_DIR)
+
+import packfile  # noqa: E402
+from dataset import write_json_array  # noqa: E402
+
+WORDS = ("azerbaijan baku government president minister agreement energy region cooperation development "
+         "international economic meeting security project culture festival conflict peace talks").split()
+AUTHORS = ("Sabina Mammadli", "Qabil Ashirov", "Laman Ismayilova", "Nazrin Abdul", None)
+
+def synthetic_articles(count, paragraphs, seed=1):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {
+            "title": " ".join(rng.choices(WORDS, k=10)).capitalize(),
+            "link": f"https://www.azernews.az/region/{300000 + i}.html",
+            "thumbnail": f"https://www.azernews.az/media/2025/07/{i % 31 + 1}/thumb_{i}.jpg",
+            "summary": " ".join(rng.choices(WORDS, k=25)),
+            "author": rng.choice(AUTHORS),
+            "author_img": "https://www.azernews.az/media/authors/author.jpg",
+            "publish_date": f"{i % 28 + 1} July 2025 {i % 24:02d}:{i % 60:02d} (UTC+04:00)",
+            "content": [" ".join(rng.choices(WORDS, k=40)).capitalize() + "." for _ in range(paragraphs)],
+        }
+
+def timed(function):
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+def peak_memory(function):
+    """Peak traced bytes of one call (run separately: tracing slows it down a lot)."""
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--paragraphs", type=int, default=8, help="paragraphs per synthetic article")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="azernews-bench-startup-")
+    os.environ.update(AZERNEWS_DATA_DIR=directory, AZERNEWS_RELOAD_INTERVAL="0")
+    import app  # noqa: E402  (reads AZERNEWS_DATA_DIR at import)
+
+    codecs = {"pack/json": packfile.CODEC_JSON}
+    if packfile.msgpack:
+        codecs["pack/msgpack"] = packfile.CODEC_MSGPACK
+    filename = app.CATEGORIES["world"]
+    try:
+        for size in args.sizes:
+            articles = list(synthetic_articles(size, args.paragraphs))
+            formats = {"json": os.path.join(directory, "json")}
+            formats.update({name: os.path.join(directory, name.replace("/", "-")) for name in codecs})
+            for name, format_dir in formats.items():
+                os.makedirs(format_dir, exist_ok=True)
+                if name == "json":
+                    with open(os.path.join(format_dir, filename), "w", encoding="utf-8") as f:
+                        write_json_array(f, articles)
+                else:
+                    with open(packfile.pack_path(os.path.join(format_dir, filename)), "wb") as f:
+                        packfile.write_pack(f, articles, codecs[name])
+            del articles
+
+            print(f"\n{size} articles")
+            baseline = None
+            for name, format_dir in formats.items():
+                app.DATA_FORMAT = "json" if name == "json" else "auto"
+                path = app.data_file("world", format_dir)
+                startup = lambda: app.article_refs(app.load_category("world", format_dir))  # noqa: E731
+                elapsed = timed(startup)
+                peak = peak_memory(startup)
+                category = app.load_category("world", format_dir)
+                first = timed(lambda: category[0])
+                full = timed(lambda: category[:])
+                baseline = baseline or elapsed
+                print(f"  {name:<14} {os.path.getsize(path) / 2**20:7.1f} MiB  startup {elapsed * 1000:9.1f} ms "
+                      f"(x{baseline / elapsed:.1f})  {peak / 2**20:7.1f} MiB peak  "
+                      f"first article {first * 1000:6.2f} ms  all articles {full * 1000:8.1f} ms")
+                del category
+            for format_dir in formats.values():
+                shutil.rmtree(format_dir)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""End-to-end benchmark: scrape the mock server, then load-test the API on the result.
+
+Starts mock_server.py with the given latency and error injection, runs the
+full crawl (cold HTTP cache, fresh data dir) and reports articles/sec,
+p50/p95 fetch latency, total parse time and peak RSS. The API is then
+served from the scraped data dir and every endpoint in load_test.py is
+load-tested. Results go to a JSON file; pass a previous one with
+--compare to see what changed.
+
+    python benchmarks/bench_suite.py [--latency 0.05] [--error-rate 0.02] [--workers 8] [--deep 3]
+                                     [--output results.json] [--compare previous.json]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(BENCH_DIR, "..")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+sys.path.insert(0, os.path.join(BACKEND_DIR, "scripts"))
+sys.path.insert(0, BACKEND_DIR)
+
+from load_test import DEFAULT_PATHS, load_test, percentile, print_result  # noqa: E402
+from mock_server import start_server  # noqa: E402
+
+# Lower is better for these; everything else numeric is higher-is-better
+LOWER_IS_BETTER = ("seconds", "ms", "bytes", "errors", "failures", "retries")
+
+def peak_rss():
+    """Peak resident set size of this process in bytes (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def bench_scrape(data_dir, workers, per_host, deep_pages):
+    # Imported here: extractor reads AZERNEWS_BASE_URL at import time
+    import crawl
+    import fetcher
+    import http_cache
+    import metrics
+
+    http_cache.CACHE_DIR = tempfile.mkdtemp(prefix="azernews-bench-cache-")
+    latencies = []
+    session_get = fetcher.session.get
+
+    def timed_get(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return session_get(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    fetcher.session.get = timed_get
+    try:
+        started = time.perf_counter()
+        results = crawl.crawl(max_workers=workers, per_host=per_host, data_dir=data_dir, incremental=False,
+                              deep_pages=deep_pages)
+        crawl.save_results(results, data_dir)
+        elapsed = time.perf_counter() - started
+    finally:
+        fetcher.session.get = session_get
+        shutil.rmtree(http_cache.CACHE_DIR, ignore_errors=True)
+
+    articles = sum(len(category) for category in results.values())
+    failures = sum(1 for category in results.values() for article in category if not article.get("content"))
+    parses, parse_seconds = metrics.scrape_parse_seconds.totals()
+    latencies.sort()
+    return {
+        "categories": len(results),
+        "articles": articles,
+        "failures": failures,
+        "seconds": round(elapsed, 3),
+        "articles_per_sec": round(articles / elapsed, 2) if elapsed else None,
+        "fetches": len(latencies),
+        "fetch_p50_ms": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+        "fetch_p95_ms": round(percentile(latencies, 95) * 1000, 2) if latencies else None,
+        "retries": fetcher.stats.retries,
+        "bytes": fetcher.stats.bytes,
+        "parses": parses,
+        "parse_seconds": round(parse_seconds, 4),
+        "peak_rss_bytes": peak_rss(),
+    }
+
+def bench_api(data_dir, concurrency, requests_total):
+    os.environ["AZERNEWS_DATA_DIR"] = data_dir
+    os.environ["AZERNEWS_RELOAD_INTERVAL"] = "0"
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    from app import app
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    server = make_server("127.0.0.1", 0, app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        return [load_test(base_url, path, concurrency, requests_total) for path in DEFAULT_PATHS]
+    finally:
+        server.shutdown()
+
+def flatten(results):
+    """{"scrape.seconds": 1.2, "api./api/articles.p99_ms": 3.4, ...} for comparisons."""
+    flat = {f"scrape.{key}": value for key, value in results["scrape"].items()}
+    for endpoint in results["api"]:
+        flat.update({f"api.{endpoint['path']}.{key}": value for key, value in endpoint.items() if key != "path"})
+    return flat
+
+def compare(current, previous_path):
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = flatten(json.load(f))
+    print(f"\n📊 Compared with {previous_path}")
+    for key, value in flatten(current).items():
+        before = previous.get(key)
+        if not isinstance(value, (int, float)) or not isinstance(before, (int, float)) or not before:
+            continue
+        change = (value - before) / before * 100
+        worse = change > 0 if key.endswith(LOWER_IS_BETTER) else change < 0
+        marker = "❌" if worse and abs(change) >= 10 else "  "
+        print(f"{marker} {key:<56} {before:>12} -> {value:<12} ({change:+.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.05, help="mock server delay per response, seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="extra random mock server delay, seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of mock responses that fail")
+    parser.add_argument("--seed", type=int, default=1, help="seed for jitter and failures")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent detail-page fetches")
+    parser.add_argument("--per-host", type=int, default=8, help="concurrent fetches against the mock host")
+    parser.add_argument("--deep", type=int, default=0, metavar="PAGES", help="also walk listing pages")
+    parser.add_argument("--concurrency", type=int, default=8, help="API load test clients")
+    parser.add_argument("--requests", type=int, default=300, help="API requests per endpoint")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/bench-<time>.json)")
+    parser.add_argument("--compare", metavar="PATH", help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    server, base_url = start_server(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                                    seed=args.seed)
+    os.environ["AZERNEWS_BASE_URL"] = base_url
+    data_dir = tempfile.mkdtemp(prefix="azernews-bench-data-")
+    try:
+        print(f"🚀 Scraping {base_url} ({args.latency * 1000:.0f} ms latency, {args.error_rate:.0%} errors)")
+        scrape = bench_scrape(data_dir, args.workers, args.per_host, args.deep)
+        print(f"📊 {scrape['articles']} articles in {scrape['seconds']}s ({scrape['articles_per_sec']}/s), "
+              f"fetch p50 {scrape['fetch_p50_ms']} ms p95 {scrape['fetch_p95_ms']} ms, "
+              f"parse {scrape['parse_seconds']}s, peak RSS {(scrape['peak_rss_bytes'] or 0) / 2**20:.1f} MiB")
+
+        print(f"\n🚀 Load testing the API ({args.concurrency} clients, {args.requests} requests per endpoint)")
+        api = bench_api(data_dir, args.concurrency, args.requests)
+        for result in api:
+            print_result(result)
+    finally:
+        server.shutdown()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    results = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "config": vars(args),
+        "scrape": scrape,
+        "api": api,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"bench-{results['timestamp'].replace(':', '')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    print(f"\n✅ Results saved to '{output}'")
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Check the deep crawler against the fixture listing pages on the stand-in server.
+
+The /region/ fixtures have three pages of six stories each. Page 2 repeats
+the last story of page 1, and every page has a sidebar linking to other
+sections' articles. Exits non-zero on the first failed check.
+
+    python benchmarks/check_deep_crawl.py
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(BACKEND_DIR, "scripts"))
+
+import deep_crawl  # noqa: E402
+import extractor  # noqa: E402
+from extractor import SPECS_BY_CATEGORY  # noqa: E402
+from mock_server import start_server  # noqa: E402
+
+PAGE_1 = [f"/region/{number}.html" for number in range(244990, 244984, -1)]
+ALL_PAGES = [f"/region/{number}.html" for number in range(244990, 244972, -1)]
+
+def crawl(base_url, known=(), max_pages=deep_crawl.MAX_PAGES):
+    """(relative links found, listing pages fetched)"""
+    fetched = []
+    fetch = deep_crawl.fetch
+
+    def counting_fetch(url, *args, **kwargs):
+        fetched.append(url)
+        return fetch(url, *args, **kwargs)
+
+    deep_crawl.fetch = counting_fetch
+    try:
+        articles = deep_crawl.deep_crawl(SPECS_BY_CATEGORY["world"], {base_url + link: {} for link in known},
+                                         max_pages)
+    finally:
+        deep_crawl.fetch = fetch
+    return [article["link"][len(base_url):] for article in articles], len(fetched)
+
+def check(name, actual, expected):
+    if actual != expected:
+        print(f"❌ {name}: expected {expected!r}, got {actual!r}")
+        sys.exit(1)
+    print(f"✅ {name}")
+
+def main():
+    server, base_url = start_server()
+    deep_crawl.BASE_URL = extractor.BASE_URL = base_url
+    try:
+        links, pages = crawl(base_url)
+        check("walks every page until the last one", pages, 3)
+        check("keeps only the listing's own articles, each once, newest first", links, ALL_PAGES)
+
+        links, pages = crawl(base_url, max_pages=2)
+        check("stops at max_pages", (pages, len(links)), (2, 12))
+
+        links, pages = crawl(base_url, known=PAGE_1)
+        check("stops at the first page of known links", (pages, links), (1, PAGE_1))
+
+        links, pages = crawl(base_url, known=PAGE_1[:3])
+        check("goes on while a page has unknown links", pages, 3)
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
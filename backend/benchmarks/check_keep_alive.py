@@ -0,0 +1,75 @@
+"""Check that runner pipelines in separate processes each get the pages they asked for.
+
+Runs a full scrape in process mode against the stand-in server with
+keep-alive connections on, then checks every stored article against its
+link: the server works the id into the first paragraph ("Story <id>: "),
+so a body that belongs to another request shows up as a mismatch.
+Repeats a few runs, since a shared connection only mixes responses up
+when two processes happen to use it at once. Exits non-zero on a failure.
+
+    python benchmarks/check_keep_alive.py [--runs 5]
+"""
+import os
+import re
+import sys
+import shutil
+import argparse
+import tempfile
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(BACKEND_DIR, "scripts"))
+
+from mock_server import start_server  # noqa: E402
+
+ARTICLE_ID = re.compile(r"/(\d+)\.html$")
+
+def mismatches(data_dir):
+    """[(link, first paragraph)] of stored articles whose body isn't their own."""
+    from crawl import SnapshotStore
+    from dataset import load_articles
+    from extractor import SPECS_BY_CATEGORY
+
+    snapshots = SnapshotStore(data_dir)
+    wrong = []
+    for spec in SPECS_BY_CATEGORY.values():
+        for article in load_articles(snapshots.resolve(spec.filename)):
+            first = (article.get("content") or [""])[0]
+            if not first.startswith(f"Story {ARTICLE_ID.search(article['link']).group(1)}: "):
+                wrong.append((article["link"], first[:40]))
+    return wrong
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    server, base_url = start_server(latency=0.01, jitter=0.02, keep_alive=True)
+    # Imported here: extractor reads AZERNEWS_BASE_URL at import time
+    os.environ["AZERNEWS_BASE_URL"] = base_url
+    import http_cache
+    import runner
+
+    failed = False
+    try:
+        for run in range(1, args.runs + 1):
+            data_dir = tempfile.mkdtemp(prefix="azernews-check-data-")
+            http_cache.CACHE_DIR = tempfile.mkdtemp(prefix="azernews-check-cache-")
+            try:
+                runner.run(processes=True, data_dir=data_dir, incremental=False)
+                wrong = mismatches(data_dir)
+            finally:
+                shutil.rmtree(data_dir, ignore_errors=True)
+                shutil.rmtree(http_cache.CACHE_DIR, ignore_errors=True)
+            if wrong:
+                failed = True
+                print(f"❌ run {run}: {len(wrong)} articles stored another page's body")
+                for link, first in wrong:
+                    print(f"   {link[len(base_url):]}: {first!r}")
+            else:
+                print(f"✅ run {run}: every article has its own body")
+    finally:
+        server.shutdown()
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
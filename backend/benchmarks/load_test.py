@@ -0,0 +1,89 @@
+"""HTTP load generator for the API: requests/sec and latency percentiles per endpoint.
+
+Runs a fixed number of requests from a pool of keep-alive clients and
+reports throughput, p50/p95/p99 latency and bytes received.
+
+    python benchmarks/load_test.py http://127.0.0.1:5000 [--path /api/articles ...] [--concurrency 8] [--requests 500]
+"""
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+DEFAULT_PATHS = ("/api/articles", "/api/articles/world", "/api/articles?unique=1&limit=20",
+                 "/api/search?q=azerbaijan")
+
+def percentile(samples, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not samples:
+        return None
+    return samples[min(len(samples) - 1, max(0, round(p / 100 * len(samples)) - 1))]
+
+def load_test(base_url, path, concurrency=8, requests_total=500, headers=None):
+    """Hit `path` `requests_total` times from `concurrency` clients and summarize."""
+    latencies = []
+    errors = 0
+    received = 0
+    lock = threading.Lock()
+    remaining = iter(range(requests_total))
+
+    def client():
+        nonlocal errors, received
+        session = requests.Session()
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            started = time.perf_counter()
+            try:
+                response = session.get(base_url + path, headers=headers, timeout=30)
+                ok = response.status_code < 400
+                size = len(response.content)
+            except requests.RequestException:
+                ok, size = False, 0
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                received += size
+                errors += not ok
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(client)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "path": path,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "requests_per_sec": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+        "bytes_received": received,
+    }
+
+def print_result(result):
+    print(f"  {result['path']:<36} {result['requests_per_sec']:>8} req/s  p50 {result['p50_ms']} ms  "
+          f"p95 {result['p95_ms']} ms  p99 {result['p99_ms']} ms  ({result['errors']} errors)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base_url", help="e.g. http://127.0.0.1:5000")
+    parser.add_argument("--path", action="append", help="endpoint to test (repeatable; default: a standard set)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint")
+    args = parser.parse_args()
+
+    print(f"🚀 Load testing {args.base_url} ({args.concurrency} clients, {args.requests} requests per endpoint)")
+    for path in args.path or DEFAULT_PATHS:
+        print_result(load_test(args.base_url.rstrip("/"), path, args.concurrency, args.requests))
+
+if __name__ == "__main__":
+    main()
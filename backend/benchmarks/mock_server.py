@@ -0,0 +1,122 @@
+"""Local stand-in for www.azernews.az serving the saved pages in fixtures/.
+
+    /                          home.html
+    /<section>/?page=N         listing_<section>_<N>.html (404 past the last page)
+    /<section>/<id>.html       one of the article_*.html pages, picked by id, with
+                               the id worked into its first paragraph so every
+                               id has distinct content (no false duplicates)
+
+Point the scrapers at it with AZERNEWS_BASE_URL=http://127.0.0.1:<port>.
+Latency (a fixed delay plus random jitter) and failing responses can be
+injected to exercise timeouts, retries and concurrency. With --keep-alive
+it speaks HTTP/1.1 and keeps connections open, as the real site does.
+
+    python benchmarks/mock_server.py [--port 8765] [--latency 0.05] [--jitter 0.02] [--error-rate 0.05]
+                                     [--keep-alive]
+"""
+import os
+import re
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+ARTICLE_PATH = re.compile(r"^/[\w-]+/(\d+)\.html$")
+LISTING_PATH = re.compile(r"^/([\w-]+)/?$")
+
+def _read_fixtures():
+    pages = {}
+    for name in os.listdir(FIXTURES_DIR):
+        if name.endswith(".html"):
+            with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+                pages[name] = f.read()
+    return pages
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    pages = {}
+    articles = []
+    latency = 0.0  # seconds before every response
+    jitter = 0.0  # plus up to this many seconds at random
+    error_rate = 0.0  # share of requests answered with error_status
+    error_status = 503
+    random = random.Random()
+
+    def resolve(self, url):
+        path = url.path
+        if path == "/":
+            return self.pages.get("home.html")
+        match = ARTICLE_PATH.match(path)
+        if match:
+            number = int(match.group(1))
+            page = self.pages[self.articles[number % len(self.articles)]]
+            return page.replace(b"<p>", f"<p>Story {number}: ".encode("utf-8"), 1)
+        match = LISTING_PATH.match(path)
+        if match:
+            page = parse_qs(url.query).get("page", ["1"])[0]
+            return self.pages.get(f"listing_{match.group(1)}_{page}.html")
+        return None
+
+    def do_GET(self):
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.send_error(self.error_status)
+            return
+        body = self.resolve(urlparse(self.path))
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_server(port=0, handler=FixtureHandler, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, seed=None,
+                 keep_alive=False):
+    """Serve the fixtures on a background thread; returns (server, base_url).
+
+    Each server gets its own handler subclass, so servers started with
+    different latency or error settings don't affect each other.
+    """
+    pages = _read_fixtures()
+    handler = type(handler.__name__, (handler,), {
+        "pages": pages,
+        "articles": sorted(name for name in pages if name.startswith("article_")),
+        "latency": latency,
+        "jitter": jitter,
+        "error_rate": error_rate,
+        "error_status": error_status,
+        "random": random.Random(seed),
+        "protocol_version": "HTTP/1.1" if keep_alive else "HTTP/1.0",
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the saved azernews fixtures locally.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to wait before every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay of up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests that fail (0-1)")
+    parser.add_argument("--error-status", type=int, default=503, help="status code of injected failures")
+    parser.add_argument("--seed", type=int, help="seed for jitter and failures, for repeatable runs")
+    parser.add_argument("--keep-alive", action="store_true", help="keep connections open (HTTP/1.1)")
+    args = parser.parse_args()
+
+    server, base_url = start_server(args.port, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                                    error_status=args.error_status, seed=args.seed, keep_alive=args.keep_alive)
+    print(f"🧪 Serving fixtures on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
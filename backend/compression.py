@@ -0,0 +1,147 @@
+import gzip
+import hashlib
+import threading
+import time
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Encodings the API can send, best first
+ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+# Cached bodies are compressed once per data version, so spend the CPU on ratio
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+# Uncached bodies (search, author filter) are compressed on every request:
+# much cheaper levels for most of the ratio
+FAST_GZIP_LEVEL = 4
+FAST_BROTLI_QUALITY = 4
+
+# Below this a compressed body is barely smaller and not worth a round of CPU
+MIN_COMPRESS_BYTES = 1024
+
+class CompressionStats:
+    """Counters for compression work done and compression work avoided by the cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.compressed = 0
+            self.bytes_in = 0
+            self.bytes_out = 0
+            self.cpu_seconds = 0.0
+            self.reused = 0
+            self.cpu_saved_seconds = 0.0
+
+    def add(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def summary(self):
+        return {
+            "compressed": self.compressed,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.bytes_in / self.bytes_out, 2) if self.bytes_out else None,
+            "cpu_seconds": round(self.cpu_seconds, 4),
+            "reused": self.reused,
+            "cpu_saved_seconds": round(self.cpu_saved_seconds, 4),
+        }
+
+stats = CompressionStats()
+
+def compress(body, encoding, fast=False):
+    """Compress `body`, recording the bytes and thread CPU time in `stats`.
+
+    `fast` picks the cheap levels, for bodies compressed on every request.
+    """
+    started = time.thread_time()
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=FAST_BROTLI_QUALITY if fast else BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(body, compresslevel=FAST_GZIP_LEVEL if fast else GZIP_LEVEL, mtime=0)
+    seconds = time.thread_time() - started
+    stats.add(compressed=1, bytes_in=len(body), bytes_out=len(compressed), cpu_seconds=seconds)
+    return compressed, seconds
+
+def choose_encoding(accept_encodings, size):
+    """Best encoding the client accepts (werkzeug's request.accept_encodings), or None."""
+    if size < MIN_COMPRESS_BYTES:
+        return None
+    return accept_encodings.best_match(ENCODINGS)
+
+class CachedBody:
+    """One serialized response plus its compressed variants, each built on first use.
+
+    Variants live as long as the body, i.e. for one data snapshot, so after
+    the first request per encoding no request does compression work. Each
+    reuse is credited with the CPU time its variant originally cost. A
+    variant is only kept while `cache` (the BodyCache holding the body)
+    has room; otherwise it is compressed at the fast levels per request.
+    """
+
+    def __init__(self, body, cache=None):
+        self.body = body
+        self.etag = hashlib.sha256(body).hexdigest()
+        self._cache = cache
+        self._variants = {}  # encoding -> (bytes, seconds spent compressing)
+
+    def variant(self, encoding):
+        """Return (bytes, etag) for `encoding`; None means the uncompressed body."""
+        if encoding is None:
+            return self.body, self.etag
+        found = self._variants.get(encoding)
+        if found is None:
+            if self._cache is not None and not self._cache.has_room():
+                found = compress(self.body, encoding, fast=True)
+            else:
+                found = self._variants[encoding] = compress(self.body, encoding)
+                if self._cache is not None:
+                    self._cache.charge(len(found[0]))
+        else:
+            stats.add(reused=1, cpu_saved_seconds=found[1])
+        # Each encoding is a different representation and needs its own strong ETag
+        return found[0], f"{self.etag}-{encoding}"
+
+class BodyCache:
+    """CachedBody objects by key, up to `max_bytes` of bodies and compressed variants.
+
+    Once the budget is spent, add() keeps nothing more, so freely varying
+    paging and projection parameters can't grow the cache without bound.
+    A variant may overshoot the budget by its own size.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def has_room(self):
+        return self.bytes < self.max_bytes
+
+    def charge(self, size):
+        with self._lock:
+            self.bytes += size
+
+    def add(self, key, body):
+        """The CachedBody kept for `key` (one built from `body` if it fits), or None if it doesn't."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self.bytes + len(body) <= self.max_bytes:
+                entry = self._entries[key] = CachedBody(body, self)
+                self.bytes += len(body)
+            return entry
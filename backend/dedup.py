@@ -0,0 +1,63 @@
+import re
+import hashlib
+
+# Cross-category duplicate detection shared by the scrapers and the API.
+# The same story is often listed under several homepage sections (and
+# sometimes under different section paths), so articles are matched on
+# their link first and on a fingerprint of their text second.
+
+# Shorter texts (empty shells, one-line stubs) are too generic to fingerprint
+MIN_FINGERPRINT_CHARS = 200
+
+def article_id(link):
+    """Stable ID: azernews' numeric article number, or a hash of the link."""
+    match = re.search(r"/(\d+)\.html$", link or "")
+    if match:
+        return match.group(1)
+    return hashlib.sha1((link or "").encode("utf-8")).hexdigest()[:12]
+
+def content_fingerprint(article):
+    """sha1 of the article text with case and whitespace normalized, or None if too short."""
+    text = " ".join(" ".join(article.get("content") or []).split()).lower()
+    if len(text) < MIN_FINGERPRINT_CHARS:
+        return None
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+def duplicate_groups(results, key=lambda article: article.get("link"), fingerprint=content_fingerprint):
+    """Group {category: articles} into unique articles, in first-seen order.
+
+    Two articles are the same if they share `key` (the link by default) or
+    both have content with the same `fingerprint`. Returns a list of
+    groups, each a list of (category, article) pairs; the first pair is the
+    copy to keep.
+    """
+    groups = []
+    index = {}  # key or fingerprint -> position in groups
+    for category, articles in results.items():
+        for article in articles:
+            article_key = key(article)
+            article_fingerprint = fingerprint(article)
+            number = index.get(article_key)
+            if number is None and article_fingerprint:
+                number = index.get(article_fingerprint)
+            if number is None:
+                number = len(groups)
+                groups.append([])
+            groups[number].append((category, article))
+            index.setdefault(article_key, number)
+            if article_fingerprint:
+                index.setdefault(article_fingerprint, number)
+    return groups
+
+def group_categories(group):
+    """Every category a group appears in, without repeats."""
+    return list(dict.fromkeys(category for category, _ in group))
+
+def mark_categories(results):
+    """Set "categories" on every article to all categories it is listed under."""
+    groups = duplicate_groups(results)
+    for group in groups:
+        categories = group_categories(group)
+        for _, article in group:
+            article["categories"] = categories
+    return len(groups)
@@ -0,0 +1,87 @@
+import os
+import gc
+import sys
+import shutil
+import tempfile
+import subprocess
+
+# Production server (Linux/macOS):
+#
+#     gunicorn -c gunicorn.conf.py app:app
+#
+# The app, and with it every category's articles, is loaded once in the
+# master before the workers are forked, so the workers share those pages
+# copy-on-write instead of each loading its own copy. Everything is
+# tunable through the environment; python serve.py (waitress) is the
+# single-process alternative, e.g. on Windows.
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Tells app.py not to start its threads in the master (see post_fork)
+os.environ["AZERNEWS_PRELOAD"] = "1"
+
+# Each worker keeps its own metrics; they are added up across workers through
+# files in this dir, so /metrics totals don't depend on which worker answers
+# (see metrics.MULTIPROCESS_DIR). A fresh dir per server start.
+METRICS_DIR = os.environ["AZERNEWS_METRICS_DIR"] = tempfile.mkdtemp(prefix="azernews-metrics-")
+
+bind = os.environ.get("AZERNEWS_BIND", "0.0.0.0:8000")
+
+# Requests are CPU-bound once the data is in memory (serializing and
+# compressing bodies), so a process per core; /api/memory reports the
+# private memory one more worker costs
+workers = int(os.environ.get("AZERNEWS_WORKERS", os.cpu_count() or 1))
+
+# Threads per worker overlap the little I/O there is (SQLite search,
+# slow clients); cached bodies make most requests a dict lookup
+worker_class = "gthread"
+threads = int(os.environ.get("AZERNEWS_THREADS", "4"))
+
+# Seconds an idle keep-alive connection is held open. Behind a proxy that
+# pools connections make it longer than the proxy's idle timeout.
+keepalive = int(os.environ.get("AZERNEWS_KEEPALIVE", "5"))
+
+# Load the app (and the data) in the master, before forking
+preload_app = True
+
+timeout = 30
+graceful_timeout = 30
+# Worker heartbeat files in memory rather than on disk
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Seconds between scrapes; when set the master runs scripts/scheduler.py
+# next to the workers, so the site is scraped once rather than per worker
+SCRAPE_INTERVAL = float(os.environ.get("AZERNEWS_SCRAPE_INTERVAL", "0"))
+
+_scheduler = None
+
+def when_ready(server):
+    global _scheduler
+    if SCRAPE_INTERVAL > 0:
+        _scheduler = subprocess.Popen([sys.executable, os.path.join(BACKEND_DIR, "scripts", "scheduler.py"),
+                                       "--interval", str(SCRAPE_INTERVAL)])
+        server.log.info("Started the scrape scheduler (pid %s)", _scheduler.pid)
+
+def pre_fork(server, worker):
+    # Move everything loaded so far out of the collector's reach: a
+    # collection would otherwise write to every object's header and undo
+    # the copy-on-write sharing of the preloaded articles
+    gc.freeze()
+
+def post_fork(server, worker):
+    # Threads started in the master don't exist in the worker; each worker
+    # watches the data files and swaps in newly published versions itself
+    import app
+    import metrics
+    app.start_background_tasks(scheduler=False)
+    metrics.start_state_writer()
+
+def worker_exit(server, worker):
+    # Keep a stopped worker's counts in the totals
+    import metrics
+    metrics.write_state()
+
+def on_exit(server):
+    if _scheduler and _scheduler.poll() is None:
+        _scheduler.terminate()
+    shutil.rmtree(METRICS_DIR, ignore_errors=True)
@@ -0,0 +1,279 @@
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+# Minimal Prometheus-style metrics shared by the scrapers and the API.
+# Metrics register themselves in REGISTRY when created; render() produces
+# the Prometheus text exposition format for /metrics or a textfile.
+#
+# Under a pre-forking server each worker has its own registry, while
+# /metrics is answered by whichever worker gets the request. With
+# AZERNEWS_METRICS_DIR set (gunicorn.conf.py does), every worker writes its
+# counters and histograms to <dir>/<pid>.json every STATE_INTERVAL seconds
+# and on exit, and the answering worker adds up all the files, so the
+# totals only ever grow (other workers' counts lag by up to STATE_INTERVAL).
+# Gauges describe one process; they are labelled
+# with the pid of the worker that answered.
+
+REGISTRY = []
+
+MULTIPROCESS_DIR = os.environ.get("AZERNEWS_METRICS_DIR")
+STATE_INTERVAL = 5
+
+# Seconds; covers a cached parse (~1 ms) up to a slow page over retries
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+# Bytes; a small JSON reply up to the full /api/articles body
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels):
+        return tuple(labels.get(name, "") for name in self.labelnames)
+
+    def render(self, values=None):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples(values))
+        return lines
+
+    def state(self):
+        """This process's values as JSON-able [[labels, value], ...] (see MULTIPROCESS_DIR)."""
+        with self._lock:
+            return [[list(key), value] for key, value in self._values.items()]
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name, help, labelnames=()):
+        super().__init__(name, help, labelnames)
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+    @staticmethod
+    def merge(total, value):
+        return (total or 0) + value
+
+    def samples(self, values=None):
+        with self._lock:
+            values = sorted((values if values is not None else self._values).items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in values]
+
+class Gauge(Metric):
+    """A value read from `function` at render time."""
+    kind = "gauge"
+
+    def __init__(self, name, help, function):
+        super().__init__(name, help)
+        self.function = function
+
+    def samples(self, values=None):
+        value = self.function()
+        labels = _format_labels((), (), [("pid", os.getpid())]) if MULTIPROCESS_DIR else ""
+        return [] if value is None else [f"{self.name}{labels} {_format_value(value)}"]
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}  # labels -> [per-bucket counts..., +Inf count, sum]
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[len(self.buckets)] += 1
+            counts[-1] += value
+
+    def totals(self):
+        """(observations, sum) across every label combination."""
+        with self._lock:
+            return (sum(sum(counts[:-1]) for counts in self._values.values()),
+                    sum(counts[-1] for counts in self._values.values()))
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    @staticmethod
+    def merge(total, counts):
+        return list(counts) if total is None else [a + b for a, b in zip(total, counts)]
+
+    def samples(self, values=None):
+        with self._lock:
+            values = sorted((key, list(counts)) for key, counts in (values if values is not None else self._values).items())
+        lines = []
+        for key, counts in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [("le", bound)])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(counts[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+def process_memory():
+    """This process's memory in bytes: rss, plus pss/private/shared where Linux reports them.
+
+    `private` is what the process alone holds, i.e. what one more worker
+    costs; pages shared copy-on-write with the other workers count under
+    `shared` (and in `pss` split between the sharers).
+    """
+    fields = {}
+    for path in ("/proc/self/smaps_rollup", "/proc/self/status"):
+        try:
+            with open(path, "r", encoding="ascii") as f:
+                for line in f:
+                    name, _, value = line.partition(":")
+                    parts = value.split()
+                    if len(parts) == 2 and parts[1] == "kB":
+                        fields.setdefault(name, int(parts[0]) * 1024)
+        except OSError:
+            continue
+    if "Rss" not in fields and "VmRSS" not in fields:
+        try:
+            import resource
+        except ImportError:
+            return {}
+        # Peak rather than current; ru_maxrss is KiB on Linux and bytes on macOS
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {"rss": maxrss if sys.platform == "darwin" else maxrss * 1024}
+    memory = {"rss": fields.get("Rss", fields.get("VmRSS"))}
+    if "Pss" in fields:
+        memory["pss"] = fields["Pss"]
+        memory["private"] = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+        memory["shared"] = fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0)
+    return memory
+
+def write_state():
+    """Save this process's counters and histograms to MULTIPROCESS_DIR."""
+    state = {metric.name: metric.state() for metric in REGISTRY if not isinstance(metric, Gauge)}
+    path = os.path.join(MULTIPROCESS_DIR, f"{os.getpid()}.json")
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(path + ".tmp", path)
+
+def _merged_state():
+    """metric name -> {labels: value} summed over every process's state file."""
+    merged = {metric.name: {} for metric in REGISTRY if not isinstance(metric, Gauge)}
+    merge = {metric.name: metric.merge for metric in REGISTRY if not isinstance(metric, Gauge)}
+    for name in os.listdir(MULTIPROCESS_DIR):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(MULTIPROCESS_DIR, name), "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for metric_name, values in state.items():
+            if metric_name in merged:
+                totals = merged[metric_name]
+                for key, value in values:
+                    totals[tuple(key)] = merge[metric_name](totals.get(tuple(key)), value)
+    return merged
+
+def start_state_writer(interval=STATE_INTERVAL):
+    """Write this process's state every `interval` seconds (call once per worker)."""
+    def loop():
+        while True:
+            time.sleep(interval)
+            try:
+                write_state()
+            except OSError as e:
+                print(f"❌ Error writing metrics state: {e}")
+    threading.Thread(target=loop, daemon=True).start()
+
+def render():
+    """Every registered metric in the Prometheus text format (summed over workers, see MULTIPROCESS_DIR)."""
+    merged = None
+    if MULTIPROCESS_DIR:
+        write_state()
+        merged = _merged_state()
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render(merged.get(metric.name) if merged is not None else None))
+    return "\n".join(lines) + "\n"
+
+def write_textfile(path):
+    """Write render() atomically, e.g. for node_exporter's textfile collector after a cron run."""
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(path + ".tmp", path)
+
+# Scraper stages. Every URL fetched or parsed is one observation; series are
+# labelled by host or page kind rather than by URL to keep their number bounded.
+scrape_fetch_seconds = Histogram("azernews_scrape_fetch_seconds", "Latency of one page fetch", ("host",))
+scrape_fetch_bytes = Counter("azernews_scrape_fetch_bytes_total", "Bytes downloaded (decoded) by the scrapers", ("host",))
+scrape_fetch_errors = Counter("azernews_scrape_fetch_errors_total", "Fetches that failed after retries", ("host",))
+scrape_fetch_retries = Counter("azernews_scrape_fetch_retries_total", "Retry attempts made by the fetch session")
+scrape_http_cache = Counter("azernews_scrape_http_cache_total", "Article page cache lookups", ("result",))
+scrape_parse_seconds = Histogram("azernews_scrape_parse_seconds", "Time to parse one page", ("kind",))
+scrape_extract_seconds = Histogram("azernews_scrape_extract_seconds", "Time to fetch, parse and extract one article")
+scrape_extract_errors = Counter("azernews_scrape_extract_errors_total", "Articles whose details could not be extracted")
+scrape_write_seconds = Histogram("azernews_scrape_write_seconds", "Time to write one category's results", ("category",))
+scrape_articles = Counter("azernews_scrape_articles_total", "Articles written", ("category",))
+
+# API
+api_request_seconds = Histogram("azernews_api_request_seconds", "Request latency", ("route", "method", "status"))
+api_response_bytes = Histogram("azernews_api_response_bytes", "Response body size as sent", ("route",),
+                               buckets=SIZE_BUCKETS)
+api_response_cache = Counter("azernews_api_response_cache_total", "Serialized-response cache lookups", ("result",))
+
+def _ratio(hits, misses):
+    total = hits + misses
+    return hits / total if total else None
+
+api_response_cache_hit_ratio = Gauge(
+    "azernews_api_response_cache_hit_ratio", "Share of cacheable responses served from the snapshot cache",
+    lambda: _ratio(api_response_cache.value(result="hit"), api_response_cache.value(result="miss")))
+scrape_http_cache_hit_ratio = Gauge(
+    "azernews_scrape_http_cache_hit_ratio", "Share of article fetches answered without a new download",
+    lambda: _ratio(scrape_http_cache.value(result="fresh") + scrape_http_cache.value(result="not_modified"),
+                   scrape_http_cache.value(result="miss")))
+
+# Process memory, per worker (each worker serves its own /metrics)
+for _kind, _help in (("rss", "Resident memory"), ("pss", "Proportional share of resident memory"),
+                     ("private", "Memory not shared with any other process")):
+    Gauge(f"azernews_process_{_kind}_bytes", _help, lambda kind=_kind: process_memory().get(kind))
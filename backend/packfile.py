@@ -0,0 +1,142 @@
+import os
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections import namedtuple
+from collections.abc import Sequence
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from dedup import article_id, content_fingerprint
+
+# Compact binary twin of a category's JSON file, for fast API startup.
+#
+#   header   b"AZPK", format version, codec, article count, index size
+#   index    [[id, link, fingerprint], ...] for every article, decoded at open
+#   offsets  count + 1 little-endian u64 offsets into the bodies
+#   bodies   one encoded article after another
+#
+# Opening a pack maps the file and decodes only the small index; an
+# article body is decoded the first time it is accessed. The index
+# carries what the API needs up front (IDs and duplicate detection).
+
+MAGIC = b"AZPK"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBxxII")
+
+CODEC_JSON = 0
+CODEC_MSGPACK = 1
+
+# msgpack when installed; compact JSON records otherwise (still lazily decoded)
+DEFAULT_CODEC = CODEC_MSGPACK if msgpack else CODEC_JSON
+
+ArticleRef = namedtuple("ArticleRef", "id link fingerprint")
+
+def pack_path(json_path):
+    """azernews_world.json -> azernews_world.pack"""
+    return os.path.splitext(json_path)[0] + ".pack"
+
+def _encoder(codec):
+    if codec == CODEC_MSGPACK:
+        return lambda value: msgpack.packb(value, use_bin_type=True)
+    return lambda value: json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _decoder(codec):
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("This pack was written with msgpack, which is not installed")
+        return lambda data: msgpack.unpackb(data, raw=False)
+    return lambda data: json.loads(bytes(data).decode("utf-8"))
+
+def write_pack(f, articles, codec=DEFAULT_CODEC):
+    """Write `articles` to the binary file `f`; every article gets its "id"."""
+    encode = _encoder(codec)
+    bodies = []
+    index = []
+    for article in articles:
+        article = {**article, "id": article.get("id") or article_id(article.get("link"))}
+        index.append([article["id"], article.get("link"), content_fingerprint(article)])
+        bodies.append(encode(article))
+
+    offsets = array("Q", [0])
+    for body in bodies:
+        offsets.append(offsets[-1] + len(body))
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    index_bytes = encode(index)
+
+    f.write(HEADER.pack(MAGIC, FORMAT_VERSION, codec, len(bodies), len(index_bytes)))
+    f.write(index_bytes)
+    f.write(offsets.tobytes())
+    for body in bodies:
+        f.write(body)
+
+class PackedArticles(Sequence):
+    """Read-only list of the articles in a pack file, decoded on first access.
+
+    Decoded articles are cached and shared by every caller; treat them as
+    read-only. Concurrent first accesses may decode the same article twice,
+    which is harmless. `record` turns a decoded dict into what is cached
+    and returned (e.g. records.Article); by default the dict itself.
+    """
+
+    def __init__(self, path, record=None):
+        self.path = path
+        self._record = record
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{path} is not a pack file")
+        magic, version, codec, count, index_size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} pack file")
+
+        self._decode = _decoder(codec)
+        view = memoryview(self._map)
+        start = HEADER.size
+        self.refs = [ArticleRef(*entry) for entry in self._decode(view[start:start + index_size])]
+        start += index_size
+        self._offsets = array("Q")
+        self._offsets.frombytes(view[start:start + 8 * (count + 1)])
+        if sys.byteorder == "big":
+            self._offsets.byteswap()
+        self._bodies = start + 8 * (count + 1)
+        if len(self._offsets) != count + 1 or self._bodies + self._offsets[-1] != len(self._map):
+            raise ValueError(f"{path} is truncated or corrupt")
+        self._view = view
+        self._cache = [None] * count
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        article = self._cache[index]
+        if article is None:
+            article = self._cache[index] = self._decode_at(range(len(self._cache))[index])
+        return article
+
+    def read(self, index):
+        """Article `index` without caching it, for one-pass reads such as streaming the whole file."""
+        return self._cache[index] or self._decode_at(range(len(self._cache))[index])
+
+    def _decode_at(self, position):
+        start = self._bodies + self._offsets[position]
+        end = self._bodies + self._offsets[position + 1]
+        article = self._decode(self._view[start:end])
+        return self._record(article) if self._record else article
+
+    def cached(self):
+        """The articles decoded so far."""
+        return [article for article in self._cache if article is not None]
+
+    def decoded(self):
+        """How many articles have been decoded so far."""
+        return len(self.cached())
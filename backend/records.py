@@ -0,0 +1,152 @@
+import sys
+from array import array
+from collections.abc import Mapping
+
+# Compact in-memory article records for the API.
+#
+# A loaded article as a plain dict costs a hash table plus one string
+# object per field and per paragraph, and the same author names, author
+# photos and image directories are repeated in every article of every
+# worker. An Article keeps its fields in __slots__ instead, interns the
+# repeated values (so one copy serves all articles), splits URLs into an
+# interned directory and a short tail, and stores the content as one
+# joined string with the paragraph end offsets in an array.
+#
+# Articles are read-only Mappings, so code written for the dicts (a["id"],
+# a.get("content"), {**a}) keeps working; dict(article) gives the plain
+# dict for serialization. An absent key is an unset slot, so it costs nothing.
+
+# Fields stored as is
+PLAIN_FIELDS = ("id", "title", "summary", "publish_date")
+# Shared by many articles: the value itself is interned
+INTERNED_FIELDS = ("author", "author_img")
+# Unique per article but with a repeated directory: "<interned dir>/" + tail
+URL_FIELDS = ("link", "thumbnail")
+
+# Key order of the dicts the records stand for (the data files' order)
+KEYS = ("title", "link", "thumbnail", "summary", "author", "author_img", "publish_date", "content",
+        "categories", "id")
+
+# Keys kept in a slot of the same name
+SLOT_KEYS = PLAIN_FIELDS + INTERNED_FIELDS + ("categories",)
+
+_categories = {}
+
+def intern_string(value):
+    return sys.intern(value) if type(value) is str else value
+
+def intern_categories(categories):
+    """One shared tuple per distinct list of categories."""
+    categories = tuple(categories)
+    return _categories.setdefault(categories, categories)
+
+def split_url(url):
+    """'https://www.azernews.az/media/2025/07/1/a.jpg' -> ('https://www.azernews.az/media/2025/07/1/', 'a.jpg')"""
+    cut = url.rfind("/") + 1
+    return intern_string(url[:cut]), url[cut:]
+
+class Article(Mapping):
+    """One article, read-only, stored compactly (see the module comment)."""
+
+    __slots__ = PLAIN_FIELDS + INTERNED_FIELDS + tuple(f"_{f}_base" for f in URL_FIELDS) + URL_FIELDS + (
+        "categories", "_text", "_ends", "_extra")
+
+    def __init__(self, article):
+        extra = None
+        for key, value in article.items():
+            if key in PLAIN_FIELDS:
+                object.__setattr__(self, key, value)
+            elif key in INTERNED_FIELDS:
+                object.__setattr__(self, key, intern_string(value))
+            elif key in URL_FIELDS:
+                if type(value) is str:
+                    base, value = split_url(value)
+                    object.__setattr__(self, f"_{key}_base", base)
+                object.__setattr__(self, key, value)
+            elif key == "content" and isinstance(value, list) and all(type(p) is str for p in value):
+                ends = array("I")
+                length = 0
+                for paragraph in value:
+                    length += len(paragraph)
+                    ends.append(length)
+                object.__setattr__(self, "_text", "".join(value))
+                object.__setattr__(self, "_ends", ends)
+            elif key == "categories" and isinstance(value, (list, tuple)):
+                object.__setattr__(self, "categories", intern_categories(value))
+            else:
+                extra = extra or {}
+                extra[key] = value
+        if extra:
+            object.__setattr__(self, "_extra", extra)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Article records are read-only")
+
+    def __getitem__(self, key):
+        if key == "content" and hasattr(self, "_text"):
+            text, ends = self._text, self._ends
+            return [text[start:end] for start, end in zip((0, *ends), ends)]
+        if key in URL_FIELDS and hasattr(self, key):
+            base = getattr(self, f"_{key}_base", None)
+            return getattr(self, key) if base is None else base + getattr(self, key)
+        if key in SLOT_KEYS and hasattr(self, key):
+            return getattr(self, key)
+        extra = getattr(self, "_extra", None)
+        if extra and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if key == "content" and hasattr(self, "_text"):
+            return True
+        if key in URL_FIELDS or key in SLOT_KEYS:
+            if hasattr(self, key):
+                return True
+        return key in (getattr(self, "_extra", None) or ())
+
+    def __iter__(self):
+        for key in KEYS:
+            if key in self:
+                yield key
+        for key in getattr(self, "_extra", None) or ():
+            if key not in KEYS:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"Article({dict(self)!r})"
+
+    def __reduce__(self):
+        return Article, (dict(self),)
+
+def compact(articles):
+    """Records for a list of article dicts."""
+    return [Article(article) for article in articles]
+
+def deep_size(*objects):
+    """Bytes held by `objects` and everything they reference, each object counted once.
+
+    Shared objects (interned strings, the categories tuples) count once
+    however many articles use them, which is the point of interning.
+    Follows dicts, lists, tuples and Articles; strings, numbers and arrays
+    are leaves.
+    """
+    seen = set()
+    total = 0
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, Article):
+            stack.extend(getattr(obj, name) for name in Article.__slots__ if hasattr(obj, name))
+    return total
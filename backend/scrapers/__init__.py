@@ -0,0 +1 @@
+"""Command-line entry point for the scrapers in scripts/: python -m scrapers run ..."""
@@ -0,0 +1,10 @@
+import os
+import sys
+
+# The scraper modules in scripts/ import each other by bare name
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from runner import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main())
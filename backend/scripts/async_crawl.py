@@ -0,0 +1,76 @@
+import os
+import time
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from crawl import DATA_DIR, fetch_homepage, load_existing
+from dataset import NdjsonJournal, index_by_link, is_current, journal_path, merge_articles
+from deep_crawl import extend_with_listing
+from enrich import MAX_WORKERS, PER_HOST_LIMIT
+from extractor import SPECS_BY_CATEGORY, extract_article_details, extract_sections
+from fetcher import stats
+
+# The blocking fetch layer (pooled session, retries, HTTP cache) runs on a
+# thread executor; asyncio only schedules the work. Every category's detail
+# pages form one task graph, and a link listed in several categories is
+# fetched once and shared.
+
+async def crawl_async(categories=None, max_workers=MAX_WORKERS, per_host=PER_HOST_LIMIT, data_dir=DATA_DIR,
+                      incremental=True, deep_pages=0):
+    """Async counterpart of crawl.crawl with the same results and journaling."""
+    stats.reset()
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=max(1, max_workers)))
+    global_limit = asyncio.Semaphore(max(1, max_workers))
+    host_limits = defaultdict(lambda: asyncio.Semaphore(max(1, per_host)))
+    fetches = {}  # link -> task, so shared links are fetched once
+    started = time.perf_counter()
+
+    async def fetch_details(link):
+        async with global_limit, host_limits[urlparse(link).netloc]:
+            fetch_started = time.perf_counter()
+            details = await loop.run_in_executor(None, extract_article_details, link)
+        print(f"⏱️ {time.perf_counter() - fetch_started:.2f}s {link}")
+        return details
+
+    async def enrich(article, stored, journal):
+        if is_current(article, stored):
+            article.update({key: value for key, value in stored.items() if key not in article})
+            return article
+        if article["link"] not in fetches:
+            fetches[article["link"]] = asyncio.ensure_future(fetch_details(article["link"]))
+        details = await fetches[article["link"]]
+        article.update(details)
+        if details:
+            journal.append(article)
+        return article
+
+    async def crawl_category(category, articles):
+        filename = SPECS_BY_CATEGORY[category].filename
+        existing = await loop.run_in_executor(None, load_existing, data_dir, filename, incremental)
+        known = index_by_link(existing)
+        if deep_pages:
+            articles = await loop.run_in_executor(None, extend_with_listing, SPECS_BY_CATEGORY[category],
+                                                  articles, known, deep_pages)
+        journal = NdjsonJournal(journal_path(os.path.join(data_dir, filename)))
+        try:
+            fresh = await asyncio.gather(*(enrich(article, known.get(article["link"]), journal)
+                                           for article in articles))
+        finally:
+            journal.close()
+        print(f"📂 {category}: {len(fresh)} articles")
+        return category, merge_articles(list(fresh), existing)
+
+    soup = await loop.run_in_executor(None, fetch_homepage)
+    sections = extract_sections(soup, categories)
+    os.makedirs(data_dir, exist_ok=True)
+    results = dict(await asyncio.gather(*(crawl_category(c, a) for c, a in sections.items())))
+
+    print(f"⏱️ {len(fetches)} pages fetched for {len(results)} categories in "
+          f"{time.perf_counter() - started:.2f}s ({max_workers} concurrent, {per_host} per host)")
+    return results
+
+def run_async(categories=None, **options):
+    return asyncio.run(crawl_async(categories, **options))
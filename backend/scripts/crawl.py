@@ -0,0 +1,213 @@
+import os
+import sys
+import argparse
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the in-process locks apply
+    fcntl = None
+
+from dataset import (NdjsonJournal, index_by_link, iter_ndjson, journal_path, load_articles,
+                     merge_articles, write_json_array)
+from deep_crawl import extend_with_listing
+from enrich import MAX_WORKERS, PER_HOST_LIMIT, enrich_articles, positive_int
+from extractor import BASE_URL, SPECS_BY_CATEGORY, extract_article_details, extract_sections
+from fetcher import fetch, metrics, stats
+import http_cache
+from parsing import parse_page
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BACKEND_DIR)
+
+from dedup import mark_categories  # noqa: E402
+from packfile import pack_path, write_pack  # noqa: E402
+from snapshots import SnapshotStore  # noqa: E402
+from store import ArticleStore, source_of  # noqa: E402
+
+DATA_DIR = os.path.abspath(os.environ.get("AZERNEWS_DATA_DIR", os.path.join(BACKEND_DIR, "data")))
+
+# Held for a whole scrape and publish by every entry point (crawl.py, the
+# runner, the scheduler), so two scrapes of one data dir never overlap
+LOCK_FILE = ".scrape.lock"
+
+@contextmanager
+def run_lock(data_dir):
+    """Cross-process lock on the data dir; yields False if another scrape holds it."""
+    if fcntl is None:
+        yield True
+        return
+    os.makedirs(data_dir, exist_ok=True)
+    with open(os.path.join(data_dir, LOCK_FILE), "w") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def fetch_homepage():
+    """Download and parse the homepage once for all categories."""
+    response = fetch(BASE_URL)
+    return parse_page(response.text)
+
+def load_existing(data_dir, filename, incremental=True):
+    """The live archive plus anything journaled by an interrupted run."""
+    if not incremental:
+        return []
+    recovered = list(iter_ndjson(journal_path(os.path.join(data_dir, filename))))
+    return merge_articles(recovered, load_articles(SnapshotStore(data_dir).resolve(filename)))
+
+def crawl(categories=None, max_workers=MAX_WORKERS, per_host=PER_HOST_LIMIT, data_dir=DATA_DIR, incremental=True,
+          deep_pages=0, soup=None):
+    """Scrape the requested categories (all by default) from a single homepage fetch.
+
+    In incremental mode only links missing from the saved files are
+    fetched, and the saved archive is carried over into the results.
+    Each enriched article is appended to an NDJSON journal next to the
+    data file; articles journaled by an interrupted run are reused.
+    With `deep_pages`, each category's own listing is also walked that
+    many pages deep (see deep_crawl). An article listed under several
+    categories is fetched once per run and reused by the later ones.
+    An already parsed homepage can be passed in as `soup`.
+    """
+    stats.reset()
+    if soup is None:
+        soup = fetch_homepage()
+
+    results = {}
+    fetched = {}  # link -> article enriched earlier in this run
+    for category, articles in extract_sections(soup, categories).items():
+        print(f"📂 Category: {category}")
+        results[category] = crawl_category(category, articles, max_workers, per_host, data_dir, incremental,
+                                           deep_pages, fetched)
+    return results
+
+def crawl_category(category, articles, max_workers=MAX_WORKERS, per_host=PER_HOST_LIMIT, data_dir=DATA_DIR,
+                   incremental=True, deep_pages=0, fetched=None):
+    """One category's pipeline, from its homepage articles to its merged archive.
+
+    `fetched` (link -> article) holds articles enriched earlier in the run
+    and is updated with this category's.
+    """
+    filename = SPECS_BY_CATEGORY[category].filename
+    existing = load_existing(data_dir, filename, incremental)
+    known = index_by_link(existing)
+    if deep_pages:
+        articles = extend_with_listing(SPECS_BY_CATEGORY[category], articles, known, deep_pages)
+    if fetched is not None:
+        known.update(fetched)
+
+    os.makedirs(data_dir, exist_ok=True)
+    journal = NdjsonJournal(journal_path(os.path.join(data_dir, filename)))
+    try:
+        fresh = enrich_articles(articles, extract_article_details, max_workers, per_host,
+                                known, on_enriched=journal.append)
+    finally:
+        journal.close()
+    if fetched is not None:
+        fetched.update(index_by_link(fresh))
+    return merge_articles(fresh, existing)
+
+def save_results(results, data_dir=DATA_DIR, store=None):
+    """Publish every category's JSON file as one new data version and sync the store.
+
+    Every article is first tagged with all the categories it appears in,
+    matched by link or by content fingerprint (see dedup), across this
+    run's results and the live version's other categories; a carried-over
+    category whose tags change is rewritten too, so the tags stay
+    consistent after a partial run. The files are
+    written fsynced into a new snapshot version that goes live in one
+    atomic switch (see snapshots), so readers never see a partial file or
+    a mix of old and new categories.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    store = store or ArticleStore(os.path.join(data_dir, "azernews.db"))
+    snapshots = SnapshotStore(data_dir)
+    carried = {category: load_articles(snapshots.resolve(spec.filename))
+               for category, spec in SPECS_BY_CATEGORY.items() if category not in results}
+    tags_before = {category: [article.get("categories") for article in data] for category, data in carried.items()}
+    everything = {category: results[category] if category in results else carried[category]
+                  for category in SPECS_BY_CATEGORY if category in results or carried.get(category)}
+    unique = mark_categories(everything)
+    total = sum(len(data) for data in everything.values())
+    if unique < total:
+        print(f"🔍 {total - unique} duplicate articles across categories")
+    retagged = [category for category, data in carried.items()
+                if [article.get("categories") for article in data] != tags_before[category]]
+    if retagged:
+        print(f"🔍 Retagging carried-over categories: {', '.join(retagged)}")
+
+    def writer(category, data, write_format):
+        def write(f):
+            with metrics.scrape_write_seconds.time(category=category):
+                write_format(f, data)
+        return write
+
+    # Each category as JSON plus its binary twin for the API's fast startup (see packfile)
+    written = {**results, **{category: carried[category] for category in retagged}}
+    writers = {}
+    for category, data in written.items():
+        filename = SPECS_BY_CATEGORY[category].filename
+        writers[filename] = writer(category, data, write_json_array)
+        writers[pack_path(filename)] = writer(category, data, write_pack)
+
+    version = snapshots.publish(writers,
+                                info={"articles": {category: len(data) for category, data in results.items()},
+                                      "retagged": retagged})
+    # Synced from the published files, so the API knows the store is current
+    # (see app.sync_store)
+    directory = snapshots.version_dir(version)
+    for category, data in written.items():
+        store.sync_category(category, data, source_of(os.path.join(directory, SPECS_BY_CATEGORY[category].filename)))
+    for category, data in results.items():
+        metrics.scrape_articles.inc(len(data), category=category)
+        # Everything journaled is in the published version now
+        journal = journal_path(os.path.join(data_dir, SPECS_BY_CATEGORY[category].filename))
+        if os.path.exists(journal):
+            os.remove(journal)
+        print(f"✅ {category} articles saved to version {version}")
+    return version
+
+def main(categories=None, description="Scrape every homepage section in one run."):
+    parser = argparse.ArgumentParser(description=description)
+    if categories is None:
+        parser.add_argument("--categories", nargs="+", choices=sorted(SPECS_BY_CATEGORY),
+                            help="categories to scrape (default: all)")
+    parser.add_argument("--workers", type=positive_int, default=MAX_WORKERS, help="concurrent detail-page fetches")
+    parser.add_argument("--per-host", type=positive_int, default=PER_HOST_LIMIT, help="concurrent fetches against one host")
+    parser.add_argument("--cache-ttl", type=int, default=http_cache.FRESH_FOR,
+                        help="seconds a cached article page is reused without revalidating")
+    parser.add_argument("--full", action="store_true",
+                        help="re-fetch every article instead of only new or changed links")
+    parser.add_argument("--deep", type=int, default=0, metavar="PAGES",
+                        help="also walk each category's listing pages this many pages deep")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="schedule every category's detail pages on one asyncio event loop")
+    parser.add_argument("--metrics-file", metavar="PATH",
+                        help="write the run's metrics here in Prometheus text format")
+    args = parser.parse_args()
+    http_cache.FRESH_FOR = args.cache_ttl
+
+    print(f"🚀 {description}")
+    options = dict(max_workers=args.workers, per_host=args.per_host, incremental=not args.full,
+                   deep_pages=args.deep)
+    with run_lock(DATA_DIR) as acquired:
+        if not acquired:
+            print("⏳ Another process is scraping this data dir, exiting")
+            sys.exit(1)
+        if args.use_async:
+            from async_crawl import run_async
+            results = run_async(categories or args.categories, **options)
+        else:
+            results = crawl(categories or args.categories, **options)
+        save_results(results)
+    print(f"📊 {stats.summary()}")
+    if args.metrics_file:
+        metrics.write_textfile(args.metrics_file)
+
+if __name__ == "__main__":
+    main()
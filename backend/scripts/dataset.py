@@ -0,0 +1,73 @@
+import os
+import json
+import threading
+
+def load_articles(file_path):
+    """Load a previously saved category file, or [] if there is none yet."""
+    if not os.path.exists(file_path):
+        return []
+    with open(file_path, "r", encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError:
+            return []
+
+def journal_path(file_path):
+    """azernews_world.json -> azernews_world.ndjson"""
+    return os.path.splitext(file_path)[0] + ".ndjson"
+
+def iter_ndjson(file_path):
+    """Yield one article per line, skipping a torn last line from a crash."""
+    if not os.path.exists(file_path):
+        return
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+class NdjsonJournal:
+    """Append-only NDJSON log of articles as they are enriched.
+
+    Each line is flushed as soon as it is written, so a run that dies
+    halfway still leaves every finished article on disk for the next run.
+    """
+
+    def __init__(self, file_path):
+        self.path = file_path
+        self._lock = threading.Lock()
+        self._file = open(file_path, "a", encoding="utf-8")
+
+    def append(self, article):
+        line = json.dumps(article, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+def write_json_array(f, articles):
+    """Same output as json.dump(articles, f, indent=4), written one article at a time."""
+    f.write("[")
+    for i, article in enumerate(articles):
+        f.write(",\n    " if i else "\n    ")
+        f.write(json.dumps(article, indent=4, ensure_ascii=False).replace("\n", "\n    "))
+    f.write("\n]" if articles else "]")
+
+def index_by_link(articles):
+    return {article["link"]: article for article in articles if article.get("link")}
+
+def is_current(article, stored):
+    """True if `stored` already holds full details for this homepage entry."""
+    return bool(stored and stored.get("content") and stored.get("title") == article.get("title"))
+
+def merge_articles(fresh, existing):
+    """Put this run's articles first, then every older article not seen again.
+
+    Articles that scrolled off the homepage are kept, so the file grows
+    into an archive instead of a rolling snapshot.
+    """
+    seen = {article["link"] for article in fresh}
+    return fresh + [article for article in existing if article.get("link") not in seen]
@@ -0,0 +1,93 @@
+import re
+from collections import deque
+from urllib.parse import urljoin
+
+from extractor import BASE_URL, absolute_url, extract_image_from_style
+from fetcher import fetch
+from parsing import parse_page
+
+# Pages walked per category by default (page 1 is the newest)
+MAX_PAGES = 5
+
+ARTICLE_LINK = re.compile(r"/[\w-]+/\d+\.html$")
+
+def listing_url(spec, page):
+    url = BASE_URL + spec.listing
+    return url if page == 1 else f"{url}?page={page}"
+
+def parse_listing(soup, page_url, guessed_next=None, container=None):
+    """Return (articles, next page URL or None) for one listing page.
+
+    Any link to an article page inside the `container` selector (the whole
+    page if None) counts; title and thumbnail are taken from inside the
+    link, matching the homepage list articles. The next page is
+    the rel="next" link; a pagination bar without one marks the last page,
+    and with no pagination bar at all `guessed_next` is used.
+    """
+    articles = []
+    scope = soup.select_one(container) if container else soup
+    for link_tag in scope.find_all("a", href=True) if scope is not None else ():
+        if not ARTICLE_LINK.search(link_tag["href"]):
+            continue
+        title_tag = link_tag.find(["h4", "h3", "h2"])
+        title = (title_tag or link_tag).text.strip()
+        if not title:
+            continue
+        img_tag = link_tag.find("img")
+        thumb_div = link_tag.find("div", class_="bg-thumb")
+        style = thumb_div.get("style", "") if thumb_div else ""
+        articles.append({
+            "title": title,
+            "link": absolute_url(link_tag["href"]),
+            "thumbnail": img_tag["src"] if img_tag else extract_image_from_style(style),
+        })
+
+    next_tag = soup.find("a", rel="next", href=True)
+    if next_tag:
+        return articles, urljoin(page_url, next_tag["href"])
+    if soup.find(class_="pagination"):
+        return articles, None
+    return articles, guessed_next
+
+def deep_crawl(spec, known=None, max_pages=MAX_PAGES):
+    """Walk a category's listing pages and return the basic articles found.
+
+    Pages are taken from a FIFO frontier that starts at page 1 and follows
+    each page's next link (see parse_listing). Every article link is kept
+    once. The walk stops at `max_pages`, at a page with no
+    new links, or at the first page whose links are all in `known`: past
+    that point the archive already has everything.
+    """
+    known = known or {}
+    frontier = deque([(listing_url(spec, 1), 1)])
+    queued = {frontier[0][0]}
+    seen = set()
+    articles = []
+
+    while frontier:
+        url, page = frontier.popleft()
+        try:
+            soup = parse_page(fetch(url).text)
+        except Exception as e:
+            print(f"❌ Error fetching listing {url}: {e}")
+            break
+
+        page_articles, next_url = parse_listing(soup, url, listing_url(spec, page + 1), spec.listing_container)
+        new = [article for article in page_articles if article["link"] not in seen]
+        seen.update(article["link"] for article in new)
+        articles.extend(new)
+        print(f"📄 {spec.category} page {page}: {len(new)} links")
+
+        if not new or all(article["link"] in known for article in new):
+            break
+        if next_url and page < max_pages and next_url not in queued:
+            queued.add(next_url)
+            frontier.append((next_url, page + 1))
+
+    return articles
+
+def extend_with_listing(spec, articles, known=None, max_pages=MAX_PAGES):
+    """Homepage articles first, then listing articles not already among them."""
+    on_homepage = {article["link"] for article in articles}
+    return articles + [article for article in deep_crawl(spec, known, max_pages)
+                       if article["link"] not in on_homepage]
@@ -0,0 +1,74 @@
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from dataset import is_current
+
+# Total detail pages fetched at once, and at most this many against one host
+MAX_WORKERS = 8
+PER_HOST_LIMIT = 4
+
+def positive_int(value):
+    """argparse type for the concurrency limits: 0 or less would never fetch anything."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+class HostLimits:
+    """One semaphore per host, each allowing `limit` fetches at once."""
+
+    def __init__(self, limit):
+        self.limit = max(1, limit)
+        self._semaphores = {}
+        self._guard = threading.Lock()
+
+    def __call__(self, url):
+        host = urlparse(url).netloc
+        with self._guard:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.limit)
+            return self._semaphores[host]
+
+def enrich_articles(articles, extract_details, max_workers=MAX_WORKERS, per_host=PER_HOST_LIMIT, known=None,
+                    on_enriched=None):
+    """Fetch details for every article on a bounded thread pool.
+
+    Results are merged into the articles in their original order.
+    `max_workers=1` gives the old sequential behaviour for comparison.
+    `known` maps link -> previously stored article; links already stored
+    with full details reuse them instead of being fetched again.
+    `on_enriched` is called with each freshly fetched article as soon as
+    it completes (from a worker thread).
+    """
+    known = known or {}
+    # Per call, so every call gets the per_host it asks for
+    host_limit = HostLimits(per_host)
+
+    def enrich(article):
+        stored = known.get(article["link"])
+        if is_current(article, stored):
+            article.update({key: value for key, value in stored.items() if key not in article})
+            return article
+
+        with host_limit(article["link"]):
+            print(f"🔍 Scraping: {article['title']}")
+            started = time.perf_counter()
+            details = extract_details(article["link"])
+            elapsed = time.perf_counter() - started
+        print(f"⏱️ {elapsed:.2f}s {article['link']}")
+        article.update(details)
+        if on_enriched and details:
+            on_enriched(article)
+        return article
+
+    reused = sum(1 for article in articles if is_current(article, known.get(article["link"])))
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        enriched = list(pool.map(enrich, articles))
+    elapsed = time.perf_counter() - started
+    print(f"⏱️ {len(enriched) - reused} fetched, {reused} already stored, in {elapsed:.2f}s "
+          f"({max_workers} workers, {per_host} per host)")
+    return enriched
@@ -0,0 +1,168 @@
+import os
+from collections import namedtuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from fetcher import metrics
+from http_cache import cached_fetch
+from parsing import parse_article
+
+# Overridable so the scrapers can run against a local stand-in server
+BASE_URL = os.environ.get("AZERNEWS_BASE_URL", "https://www.azernews.az")
+
+# How to pull one category out of its homepage block.
+#   header     <h2> text of the block, lowercased
+#   container  class of the block div ("col-12" or "col-md-6")
+#   featured   (selector of the featured block or None for the section
+#              itself, class of its <a>), or None if there is no featured article
+#   items      selector of the smaller list articles
+#   summary    whether the featured excerpt is kept as "summary"
+#   listing    path of the category's own paginated listing (deep crawl)
+#   listing_container  selector of the element holding the listing's
+#              articles; links outside it (navigation, "latest" and
+#              "most read" sidebars, footer) belong to other sections
+SectionSpec = namedtuple("SectionSpec",
+                         "category header container featured items summary filename listing listing_container",
+                         defaults=("main div.row",))
+
+SPECS = (
+    SectionSpec("nation", "nation", "col-12", ("div.index-block-custom", "news-item large"), "div.col-md-6 ul.list-unstyled li", True, "azernews_nation.json", "/nation/"),
+    SectionSpec("analysis", "analysis", "col-12", None, "div.col-md-6 ul.list-unstyled li", True, "azernews_analysis.json", "/analysis/"),
+    SectionSpec("armenian-azerbaijan-conflict", "armenian-azerbaijani conflict", "col-12", ("div.index-block-custom", "news-item large"), "div.col-md-6 ul.list-unstyled li", True, "azernews_conflict.json", "/karabakh/"),
+    SectionSpec("armenian-aggression", "armenian aggression", "col-md-6", (None, "news-item mb-3"), "ul.list-unstyled li", False, "azernews_aggression_full.json", "/aggression/"),
+    SectionSpec("world", "world", "col-md-6", (None, "news-item mb-3"), "ul.list-unstyled li", True, "azernews_world.json", "/region/"),
+    SectionSpec("culture", "culture", "col-md-6", (None, "news-item mb-3"), "ul.list-unstyled li", True, "azernews_culture.json", "/culture/"),
+)
+
+SPECS_BY_CATEGORY = {spec.category: spec for spec in SPECS}
+
+CONTAINERS = tuple(sorted({spec.container for spec in SPECS}))
+
+def extract_image_from_style(style_str):
+    """Extract image URL from style="background-image: url(...)"."""
+    if "url('" in style_str:
+        return style_str.split("url('")[1].split("')")[0]
+    return None
+
+def canonical_url(url):
+    """One spelling per page: lowercase scheme and host, no fragment or utm_* tracking parameters."""
+    parts = urlsplit(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if not k.startswith("utm_")])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+def absolute_url(link):
+    return canonical_url(link if link.lower().startswith("http") else BASE_URL + link)
+
+def find_sections(soup):
+    """Collect every section block in one pass, keyed by (class, <h2> text).
+
+    The first block in document order wins, matching what a per-category
+    `soup.find_all(...)` scan would return.
+    """
+    sections = {}
+    for block in soup.find_all("div", class_=CONTAINERS):
+        header = block.find("h2")
+        if not header:
+            continue
+        title = header.text.strip().lower()
+        for css_class in block.get("class", []):
+            if css_class in CONTAINERS:
+                sections.setdefault((css_class, title), block)
+    return sections
+
+def parse_section(spec, section):
+    """Extract the basic article data from one category block."""
+    articles = []
+
+    # 1. Featured article
+    if spec.featured:
+        block_selector, link_class = spec.featured
+        block = section.select_one(block_selector) if block_selector else section
+        link_tag = block.find("a", class_=link_class) if block else None
+        img_tag = link_tag.find("img") if link_tag else None
+        title_tag = block.find("h3") if block else None
+        if link_tag and img_tag and title_tag:
+            article = {
+                "title": title_tag.text.strip(),
+                "link": absolute_url(link_tag["href"]),
+                "thumbnail": img_tag["src"],
+            }
+            if spec.summary:
+                excerpt_tag = block.find("p")
+                article["summary"] = excerpt_tag.text.strip() if excerpt_tag else None
+            articles.append(article)
+
+    # 2. List articles
+    for item in section.select(spec.items):
+        link_tag = item.find("a", class_="news-item-sm")
+        if not link_tag:
+            continue
+
+        title_tag = link_tag.find("h4")
+        thumb_div = link_tag.find("div", class_="bg-thumb")
+        style = thumb_div.get("style", "") if thumb_div else ""
+
+        articles.append({
+            "title": title_tag.text.strip() if title_tag else None,
+            "link": absolute_url(link_tag["href"]),
+            "thumbnail": extract_image_from_style(style),
+        })
+
+    return articles
+
+def extract_sections(soup, categories=None):
+    """Extract every requested category from one parsed homepage.
+
+    Returns {category: [article, ...]}; categories whose block is missing
+    are reported and left out.
+    """
+    sections = find_sections(soup)
+    results = {}
+    for spec in SPECS:
+        if categories and spec.category not in categories:
+            continue
+        section = sections.get((spec.container, spec.header))
+        if section is None:
+            print(f"❌ No '{spec.header}' section found.")
+            continue
+        results[spec.category] = parse_section(spec, section)
+    return results
+
+def extract_article_details(url):
+    """Fetch detailed info from the article page."""
+    with metrics.scrape_extract_seconds.time():
+        return _extract_article_details(url)
+
+def _extract_article_details(url):
+    try:
+        soup = parse_article(cached_fetch(url))
+
+        author = None
+        author_img = None
+        author_section = soup.find("div", class_="author")
+        if author_section:
+            name_tag = author_section.find("h6")
+            author = name_tag.text.strip() if name_tag else None
+            img_tag = author_section.find("img")
+            author_img = img_tag["src"] if img_tag else None
+
+        date_tag = soup.find("span", class_="me-3")
+        publish_date = date_tag.text.strip() if date_tag else None
+
+        full_content = []
+        content = soup.find("div", class_="article-content")
+        if content:
+            paragraphs = content.find_all("p")
+            full_content = [p.text.strip() for p in paragraphs if p.text.strip()]
+
+        return {
+            "author": author,
+            "author_img": author_img,
+            "publish_date": publish_date,
+            "content": full_content
+        }
+
+    except Exception as e:
+        print(f"❌ Error extracting from {url}: {e}")
+        metrics.scrape_extract_errors.inc()
+        return {}
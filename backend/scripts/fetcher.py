@@ -0,0 +1,123 @@
+import os
+import sys
+import time
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# metrics.py lives in backend/, shared with the API
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import metrics  # noqa: E402
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode "br" responses)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 20
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5  # 0.5s, 1s, 2s between attempts
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+POOL_SIZE = 16
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; AzernewsScraper/1.0)",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+class FetchStats:
+    """Per-run counters shared by every thread using the session."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.errors = 0
+            self.bytes = 0
+            self.wire_bytes = 0
+            self.cache_hits = 0
+            self.not_modified = 0
+
+    def add(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def summary(self):
+        return (f"{self.requests} requests, {self.retries} retries, {self.errors} errors, "
+                f"{self.wire_bytes / 1024:.1f} KiB downloaded ({self.bytes / 1024:.1f} KiB decoded), "
+                f"{self.cache_hits} cache hits, {self.not_modified} not modified")
+
+stats = FetchStats()
+
+class CountingRetry(Retry):
+    """Retry policy that records every retry attempt in `stats`."""
+
+    def increment(self, *args, **kwargs):
+        new_retry = super().increment(*args, **kwargs)
+        stats.add(retries=1)
+        metrics.scrape_fetch_retries.inc()
+        return new_retry
+
+def _build_session():
+    retry = CountingRetry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET", "HEAD"),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+session = _build_session()
+
+def reset_session():
+    """Give this process a session of its own.
+
+    A forked child inherits the parent's pooled keep-alive sockets; used
+    from two processes at once, one socket would hand each its responses
+    in whatever order they arrive. Run this first thing in a child.
+    """
+    global session
+    session = _build_session()
+
+def fetch(url, headers=None):
+    """GET `url` through the shared keep-alive session.
+
+    Raises `requests.HTTPError` once retries are exhausted, so callers
+    never parse an error page as if it were an article.
+    """
+    host = urlparse(url).netloc
+    started = time.perf_counter()
+    try:
+        response = session.get(url, headers=headers, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+        body = response.content
+    except requests.RequestException:
+        stats.add(requests=1, errors=1)
+        metrics.scrape_fetch_errors.inc(host=host)
+        raise
+    finally:
+        metrics.scrape_fetch_seconds.observe(time.perf_counter() - started, host=host)
+    stats.add(requests=1, bytes=len(body), wire_bytes=response.raw.tell() or len(body))
+    metrics.scrape_fetch_bytes.inc(len(body), host=host)
+    if response.status_code >= 400:
+        stats.add(errors=1)
+        metrics.scrape_fetch_errors.inc(host=host)
+        response.raise_for_status()
+    return response
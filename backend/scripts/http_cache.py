@@ -0,0 +1,136 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+from fetcher import fetch, metrics, stats
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cache", "http")
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+
+# Seconds a cached page is trusted without asking the server at all.
+# 0 means every hit is revalidated with a conditional GET.
+FRESH_FOR = 0
+
+_evict_lock = threading.Lock()
+_cache_bytes = None  # running total, computed on first eviction pass
+
+def _paths(url):
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, key + ".json"), os.path.join(CACHE_DIR, key + ".html")
+
+def _write_atomic(path, data):
+    # Unique per process and thread: pipelines in forked processes reuse thread idents
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _load(url):
+    meta_path, body_path = _paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "r", encoding="utf-8") as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    return meta, body
+
+def _store(url, meta, body=None):
+    meta_path, body_path = _paths(url)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    written = 0
+    if body is not None:
+        data = body.encode("utf-8")
+        _write_atomic(body_path, data)
+        written += len(data)
+    data = json.dumps(meta).encode("utf-8")
+    _write_atomic(meta_path, data)
+    return written + len(data)
+
+def _account(written):
+    global _cache_bytes
+    with _evict_lock:
+        if _cache_bytes is not None:
+            _cache_bytes += written
+        over = _cache_bytes is None or _cache_bytes > MAX_CACHE_BYTES
+    if over:
+        evict()
+
+def evict(max_bytes=None):
+    """Drop least recently used entries until the cache fits in `max_bytes`."""
+    global _cache_bytes
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    with _evict_lock:
+        if not os.path.isdir(CACHE_DIR):
+            return
+        entries = []
+        total = 0
+        for name in os.listdir(CACHE_DIR):
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(CACHE_DIR, name)
+            body_path = meta_path[:-len(".json")] + ".html"
+            try:
+                size = os.path.getsize(meta_path) + os.path.getsize(body_path)
+                used = os.path.getmtime(meta_path)
+            except OSError:
+                continue
+            entries.append((used, size, meta_path, body_path))
+            total += size
+
+        entries.sort()
+        for _, size, meta_path, body_path in entries:
+            if total <= max_bytes:
+                break
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+        _cache_bytes = total
+
+def cached_fetch(url, fresh_for=None):
+    """Return the HTML for `url`, using the on-disk cache where possible.
+
+    Entries younger than `fresh_for` seconds are served without touching
+    the network; older ones are revalidated with If-None-Match /
+    If-Modified-Since so an unchanged page costs a bodiless 304.
+    """
+    fresh_for = FRESH_FOR if fresh_for is None else fresh_for
+    meta, body = _load(url)
+
+    if meta and fresh_for and time.time() - meta["fetched_at"] < fresh_for:
+        stats.add(cache_hits=1)
+        metrics.scrape_http_cache.inc(result="fresh")
+        os.utime(_paths(url)[0])
+        return body
+
+    headers = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = fetch(url, headers=headers)
+    if response.status_code == 304 and meta:
+        stats.add(not_modified=1)
+        metrics.scrape_http_cache.inc(result="not_modified")
+        meta["fetched_at"] = time.time()
+        _store(url, meta)
+        return body
+
+    metrics.scrape_http_cache.inc(result="miss")
+    body = response.text
+    written = _store(url, {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+    }, body)
+    _account(written)
+    return body
@@ -0,0 +1,19 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+from fetcher import metrics
+
+PARSER = "lxml"
+
+# The only parts of an article page extract_article_details reads:
+# div.author, span.me-3 (publish date) and div.article-content
+ARTICLE_PARTS = SoupStrainer(["div", "span"], class_=["author", "me-3", "article-content"])
+
+def parse_page(html):
+    """Parse a full page (the homepage) with the lxml backend."""
+    with metrics.scrape_parse_seconds.time(kind="page"):
+        return BeautifulSoup(html, PARSER)
+
+def parse_article(html):
+    """Parse only the article-page subtrees that hold author, date and content."""
+    with metrics.scrape_parse_seconds.time(kind="article"):
+        return BeautifulSoup(html, PARSER, parse_only=ARTICLE_PARTS)
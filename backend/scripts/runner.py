@@ -0,0 +1,244 @@
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from crawl import DATA_DIR, SnapshotStore, crawl_category, fetch_homepage, run_lock, save_results
+from dataset import index_by_link, merge_articles
+from enrich import MAX_WORKERS, PER_HOST_LIMIT, positive_int
+from extractor import SPECS_BY_CATEGORY, extract_sections
+from fetcher import reset_session, stats
+import http_cache
+
+# Category pipelines run at once; each has its own fetch thread pool
+PIPELINES = 3
+
+# Fetch counters reported per category and for the whole run
+COUNTERS = ("requests", "wire_bytes", "retries", "errors")
+
+def run_pipeline(category, articles, options, cache_ttl=None, isolated=True):
+    """Run one category's pipeline and measure it; runs in a worker process or thread.
+
+    Fetch counters are only per category when `isolated` (the pipeline
+    has its process to itself). Never raises: an exception is reported in
+    the summary so the other categories still get published.
+    """
+    if cache_ttl is not None:
+        http_cache.FRESH_FOR = cache_ttl  # spawned processes don't inherit it
+    if isolated:
+        stats.reset()
+    started = time.perf_counter()
+    data, error = None, None
+    try:
+        data = crawl_category(category, articles, **options)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        print(f"❌ {category} failed: {error}")
+    summary = {
+        "articles": len(data) if data is not None else 0,
+        "failures": sum(1 for article in data or () if not article.get("content")),
+        "duration": round(time.perf_counter() - started, 3),
+        "error": error,
+    }
+    if isolated:
+        summary.update({name: getattr(stats, name) for name in COUNTERS})
+    return category, data, summary
+
+def assign_links(sections):
+    """Give every homepage link to the first category listing it.
+
+    Returns ({category: articles its pipeline fetches}, {link: owning category}),
+    so a story listed under several sections is fetched by one pipeline only.
+    """
+    owners = {}
+    assigned = {}
+    for category, articles in sections.items():
+        assigned[category] = [article for article in articles
+                              if owners.setdefault(article["link"], category) == category]
+    return assigned, owners
+
+def fill_shared(category, articles, data, enriched, owners):
+    """`data` with the links another pipeline fetched put back in homepage order.
+
+    A shared link takes the owner's details under this section's own
+    listing fields; if the owner failed, this category's stored copy (or
+    the bare listing entry) is used instead.
+    """
+    by_link = index_by_link(data)
+    homepage = []
+    for article in articles:
+        link = article["link"]
+        if owners.get(link) == category:
+            homepage.append(by_link.get(link, article))
+        else:
+            homepage.append({**(enriched.get(link) or by_link.get(link) or {}), **article})
+    return merge_articles(homepage, data)
+
+def run(categories=None, pipelines=PIPELINES, processes=True, data_dir=DATA_DIR, **options):
+    """Fetch the homepage once, then run every category's pipeline concurrently.
+
+    With `processes` each pipeline gets its own process, so parsing uses
+    every core and fetch counters are reported per category. In thread
+    mode pipelines share one process and only the run totals are counted.
+    A link listed under several homepage sections is fetched once, by the
+    first category's pipeline, and copied into the others afterwards
+    (links found with deep_pages are not shared this way).
+    Results are published together with save_results. Returns
+    {category: summary} plus the run totals under "_run", or None if
+    another process (cron, the scheduler) is scraping `data_dir`.
+    """
+    with run_lock(data_dir) as acquired:
+        if not acquired:
+            return None
+        return _run(categories, pipelines, processes, data_dir, **options)
+
+def _run(categories, pipelines, processes, data_dir, **options):
+    started = time.perf_counter()
+    stats.reset()
+    soup = fetch_homepage()
+    sections = extract_sections(soup, categories)
+    options = dict(options, data_dir=data_dir)
+
+    assigned, owners = assign_links(sections)
+    workers = max(1, min(pipelines, len(sections) or 1))
+    # The homepage fetch left a keep-alive socket in the pool; worker
+    # processes must not share it, so each builds its own session
+    if processes:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=reset_session)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    with executor as pool:
+        futures = [pool.submit(run_pipeline, category, articles, options, http_cache.FRESH_FOR, processes)
+                   for category, articles in assigned.items()]
+        outcomes = [future.result() for future in futures]
+
+    results = {category: data for category, data, _ in outcomes if data is not None}
+    enriched = {link: article for category, data in results.items()
+                for link, article in index_by_link(data).items() if owners.get(link) == category}
+    for category, data in results.items():
+        shared = len(sections[category]) - len(assigned[category])
+        if shared:
+            results[category] = fill_shared(category, sections[category], data, enriched, owners)
+    write_started = time.perf_counter()
+    version = save_results(results, data_dir) if results else None
+    write_seconds = time.perf_counter() - write_started
+
+    summaries = {category: summary for category, _, summary in outcomes}
+    for category in summaries:
+        summaries[category]["published"] = category in results
+        summaries[category]["shared"] = len(sections[category]) - len(assigned[category])
+        if category in results:
+            summaries[category]["articles"] = len(results[category])
+            summaries[category]["failures"] = sum(1 for a in results[category] if not a.get("content"))
+    missing = [category for category in categories or SPECS_BY_CATEGORY if category not in sections]
+    for category in missing:
+        summaries[category] = {"articles": 0, "failures": 0, "published": False, "error": "section not on homepage"}
+    # This process's counters: the homepage, plus every pipeline in thread mode
+    totals = {name: getattr(stats, name) + sum(s.get(name, 0) for s in summaries.values()) for name in COUNTERS}
+    summaries["_run"] = {
+        **totals,
+        "duration": round(time.perf_counter() - started, 3),
+        "write_duration": round(write_seconds, 3),
+        "data_dir": data_dir,
+        "version": version,
+        "mode": "processes" if processes else "threads",
+        "pipelines": pipelines,
+    }
+    return summaries
+
+def print_summary(summaries):
+    print("\n📊 Summary")
+    for category, summary in summaries.items():
+        if category == "_run":
+            continue
+        status = "✅" if summary.get("published") else "❌"
+        line = (f"{status} {category:<30} {summary['articles']:>5} articles  {summary['failures']:>3} failures")
+        if "wire_bytes" in summary:
+            line += f"  {summary['wire_bytes'] / 1024:>8.1f} KiB"
+        if "duration" in summary:
+            line += f"  {summary['duration']:>7.2f}s"
+        if summary.get("error"):
+            line += f"  ({summary['error']})"
+        print(line)
+    totals = summaries["_run"]
+    print(f"⏱️ {totals['duration']:.2f}s total, {totals['write_duration']:.2f}s writing, "
+          f"{totals['requests']} requests, {totals['wire_bytes'] / 1024:.1f} KiB downloaded")
+
+def list_versions(snapshots):
+    current = snapshots.current_version()
+    for version in snapshots.versions():
+        articles = snapshots.manifest(version).get("articles", {})
+        marker = "▶" if version == current else " "
+        print(f"{marker} {version}  {sum(articles.values()):>6} articles written  ({', '.join(articles)})")
+    if current is None:
+        print("📂 Nothing published yet; the files in the data dir are live")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m scrapers", description="Azernews scraper runner.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="scrape categories concurrently and publish the results")
+    run_parser.add_argument("--categories", nargs="+", default=["all"], choices=["all"] + sorted(SPECS_BY_CATEGORY),
+                            help="categories to scrape (default: all)")
+    run_parser.add_argument("--pipelines", type=positive_int, default=PIPELINES, help="categories scraped at once")
+    run_parser.add_argument("--threads", action="store_true", help="run pipelines as threads instead of processes")
+    run_parser.add_argument("--workers", type=positive_int, default=MAX_WORKERS,
+                            help="concurrent detail-page fetches per pipeline")
+    run_parser.add_argument("--per-host", type=positive_int, default=PER_HOST_LIMIT,
+                            help="concurrent fetches against one host, per pipeline")
+    run_parser.add_argument("--data-dir", default=DATA_DIR, help=f"where to write the data files (default: {DATA_DIR})")
+    run_parser.add_argument("--cache-ttl", type=int, default=http_cache.FRESH_FOR,
+                            help="seconds a cached article page is reused without revalidating")
+    run_parser.add_argument("--full", action="store_true",
+                            help="re-fetch every article instead of only new or changed links")
+    run_parser.add_argument("--deep", type=int, default=0, metavar="PAGES",
+                            help="also walk each category's listing pages this many pages deep "
+                                 "(links found there are fetched by each category's own pipeline)")
+    run_parser.add_argument("--summary", metavar="PATH", help="also write the summary as JSON ('-' for stdout)")
+    versions_parser = commands.add_parser("versions", help="list the published data versions")
+    rollback_parser = commands.add_parser("rollback", help="make an earlier data version live again")
+    rollback_parser.add_argument("version", nargs="?", help="version to restore (default: the one before the live one)")
+    for command_parser in (versions_parser, rollback_parser):
+        command_parser.add_argument("--data-dir", default=DATA_DIR, help=f"data dir (default: {DATA_DIR})")
+    args = parser.parse_args(argv)
+
+    if args.command == "versions":
+        return list_versions(SnapshotStore(os.path.abspath(args.data_dir)))
+    if args.command == "rollback":
+        try:
+            version = SnapshotStore(os.path.abspath(args.data_dir)).rollback(args.version)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        print(f"✅ Version {version} is live (the API picks it up on its next reload)")
+        return 0
+
+    http_cache.FRESH_FOR = args.cache_ttl
+
+    categories = None if "all" in args.categories else args.categories
+    try:
+        summaries = run(categories, pipelines=args.pipelines, processes=not args.threads,
+                        data_dir=os.path.abspath(args.data_dir), max_workers=args.workers, per_host=args.per_host,
+                        incremental=not args.full, deep_pages=args.deep)
+    except Exception as e:
+        print(f"❌ Run failed: {e}")
+        return 2
+    if summaries is None:
+        print("⏳ Another process is scraping this data dir, exiting")
+        return 3
+
+    print_summary(summaries)
+    if args.summary == "-":
+        json.dump(summaries, sys.stdout, indent=4)
+        print()
+    elif args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summaries, f, indent=4)
+    # Non-zero for cron when any requested category was not published
+    # (2: the run failed, 3: another scrape held the lock)
+    return 0 if all(s.get("published", True) for c, s in summaries.items() if c != "_run") else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
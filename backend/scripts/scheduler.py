@@ -0,0 +1,192 @@
+import os
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+
+from crawl import DATA_DIR, crawl, fetch_homepage, run_lock, save_results
+from enrich import MAX_WORKERS, PER_HOST_LIMIT, positive_int
+from extractor import SPECS, SPECS_BY_CATEGORY, find_sections, parse_section
+
+# Seconds between scrapes of a category, and how far each wait may be
+# randomly stretched or shortened (as a fraction) so runs don't align
+DEFAULT_INTERVAL = 15 * 60
+JITTER = 0.1
+
+# Seconds to wait before trying again when another run holds the lock
+# (at most a category's own interval)
+LOCKED_RETRY = 60
+
+# Section hashes of the last published scrape, so --once runs from cron can skip too
+STATE_FILE = ".section_hashes.json"
+
+def section_hashes(soup):
+    """category -> sha1 of the basic articles in its homepage block.
+
+    Hashing the extracted titles, links and thumbnails rather than the raw
+    HTML ignores markup churn that does not change what would be scraped.
+    """
+    sections = find_sections(soup)
+    hashes = {}
+    for spec in SPECS:
+        section = sections.get((spec.container, spec.header))
+        if section is not None:
+            articles = json.dumps(parse_section(spec, section), sort_keys=True)
+            hashes[spec.category] = hashlib.sha1(articles.encode("utf-8")).hexdigest()
+    return hashes
+
+class Scheduler:
+    """Re-scrape each category on its own interval from one background loop.
+
+    Categories that are due together share one homepage fetch. A category
+    whose homepage block hashes the same as at its last scrape is skipped
+    until its next turn. Runs never overlap: within a process a second run
+    is skipped while one is in progress, and across processes (a daemon
+    next to the API's own scheduler thread) the data dir is locked.
+    Results are published with crawl.save_results, which swaps each data
+    file in whole; `on_publish` is then called with the categories written.
+    """
+
+    def __init__(self, intervals, data_dir=DATA_DIR, jitter=JITTER, on_publish=None, **crawl_options):
+        self.intervals = intervals
+        self.data_dir = data_dir
+        self.jitter = jitter
+        self.on_publish = on_publish
+        self.crawl_options = crawl_options
+        self.hashes = self._load_hashes()
+        self.due = {category: 0 for category in intervals}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _load_hashes(self):
+        try:
+            with open(os.path.join(self.data_dir, STATE_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_hashes(self):
+        path = os.path.join(self.data_dir, STATE_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.hashes, f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def every(cls, interval, categories=None, **options):
+        return cls({category: interval for category in categories or SPECS_BY_CATEGORY}, **options)
+
+    def _schedule(self, category):
+        interval = self.intervals[category]
+        self.due[category] = time.time() + interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _postpone(self):
+        """Retry the due categories after LOCKED_RETRY, so a held lock isn't polled in a tight loop."""
+        now = time.time()
+        for category, at in self.due.items():
+            if at <= now:
+                self.due[category] = now + min(LOCKED_RETRY, self.intervals[category])
+
+    def run_once(self, categories=None):
+        """Scrape `categories` (default: the due ones) if their section changed.
+
+        Returns the categories published, or None if another run held the
+        lock; the due categories are then retried after LOCKED_RETRY.
+        """
+        if not self._lock.acquire(blocking=False):
+            print("⏳ Previous scrape still running, skipping this turn")
+            self._postpone()
+            return None
+        try:
+            with run_lock(self.data_dir) as acquired:
+                if not acquired:
+                    print(f"⏳ Another process is scraping, retrying in {LOCKED_RETRY}s")
+                    self._postpone()
+                    return None
+                return self._run(categories)
+        finally:
+            self._lock.release()
+
+    def _run(self, categories=None):
+        now = time.time()
+        due = categories or [category for category, at in self.due.items() if at <= now]
+        if not due:
+            return []
+        for category in due:
+            self._schedule(category)
+
+        soup = fetch_homepage()
+        hashes = section_hashes(soup)
+        changed = [category for category in due if category in hashes and hashes[category] != self.hashes.get(category)]
+        unchanged = [category for category in due if category not in changed]
+        if unchanged:
+            print(f"⏭️ Unchanged since last scrape: {', '.join(unchanged)}")
+        if not changed:
+            return []
+
+        print(f"🚀 Scheduled scrape: {', '.join(changed)}")
+        results = crawl(changed, data_dir=self.data_dir, soup=soup, **self.crawl_options)
+        save_results(results, self.data_dir)
+        # Only remember a hash once its category is safely published
+        self.hashes.update({category: hashes[category] for category in results})
+        self._save_hashes()
+        if self.on_publish:
+            self.on_publish(list(results))
+        return list(results)
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"❌ Scheduled scrape failed: {e}")
+            self._stop.wait(max(0, min(self.due.values()) - time.time()))
+
+    def start(self):
+        thread = threading.Thread(target=self.run_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+def parse_every(value):
+    """'world=600' -> ('world', 600.0)"""
+    category, _, seconds = value.partition("=")
+    if category not in SPECS_BY_CATEGORY or not seconds:
+        raise argparse.ArgumentTypeError(f"expected CATEGORY=SECONDS, got {value!r}")
+    return category, float(seconds)
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep the data files fresh by scraping on a schedule.")
+    parser.add_argument("--categories", nargs="+", choices=sorted(SPECS_BY_CATEGORY),
+                        help="categories to keep fresh (default: all)")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between scrapes")
+    parser.add_argument("--every", type=parse_every, action="append", default=[], metavar="CATEGORY=SECONDS",
+                        help="per-category interval, overriding --interval")
+    parser.add_argument("--jitter", type=float, default=JITTER,
+                        help="randomly vary each wait by up to this fraction of the interval")
+    parser.add_argument("--workers", type=positive_int, default=MAX_WORKERS, help="concurrent detail-page fetches")
+    parser.add_argument("--per-host", type=positive_int, default=PER_HOST_LIMIT, help="concurrent fetches against one host")
+    parser.add_argument("--deep", type=int, default=0, metavar="PAGES",
+                        help="also walk each category's listing pages this many pages deep")
+    parser.add_argument("--once", action="store_true", help="scrape once and exit (for cron)")
+    args = parser.parse_args()
+
+    intervals = {category: args.interval for category in args.categories or SPECS_BY_CATEGORY}
+    intervals.update(args.every)
+    scheduler = Scheduler(intervals, jitter=args.jitter, max_workers=args.workers, per_host=args.per_host,
+                          deep_pages=args.deep)
+    if args.once:
+        scheduler.run_once()
+        return
+
+    print(f"🚀 Scheduler started for {', '.join(intervals)}")
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Serve the API with waitress: one process with a pool of threads, on any OS.
+
+    python serve.py [--host 0.0.0.0] [--port 8000] [--threads 8]
+
+On Linux/macOS gunicorn -c gunicorn.conf.py app:app scales across cores
+with several worker processes sharing the loaded data.
+"""
+import os
+import argparse
+
+from waitress import serve
+
+from app import app
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=os.environ.get("AZERNEWS_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("AZERNEWS_PORT", "8000")))
+    parser.add_argument("--threads", type=int, default=int(os.environ.get("AZERNEWS_THREADS", "8")),
+                        help="requests handled at once")
+    parser.add_argument("--keepalive", type=int, default=int(os.environ.get("AZERNEWS_KEEPALIVE", "5")),
+                        help="seconds an idle keep-alive connection is held open")
+    args = parser.parse_args()
+
+    print(f"🚀 Serving the Azernews API on http://{args.host}:{args.port} ({args.threads} threads)")
+    serve(app, host=args.host, port=args.port, threads=args.threads, channel_timeout=args.keepalive,
+          ident="azernews")
+
+if __name__ == "__main__":
+    main()
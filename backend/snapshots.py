@@ -0,0 +1,176 @@
+import os
+import json
+import shutil
+from datetime import datetime, timezone
+
+# Versioned, crash-safe data files shared by the scrapers (writers) and the API (reader).
+#
+#   data/snapshots/<version>/azernews_world.json ...   one complete, never-modified set
+#   data/current                                       name of the live version
+#
+# A publish writes a new version directory (files fsynced, unchanged
+# categories hard-linked from the live version) and only then swaps
+# `current` with an atomic rename. Readers resolve `current` once and read
+# everything from that directory, so they always see one consistent
+# version without taking any lock. Rolling back is rewriting `current`.
+# Before the first publish the files directly in data/ are the live set.
+
+SNAPSHOTS_DIR = "snapshots"
+POINTER = "current"
+MANIFEST = "manifest.json"
+
+# Files that make up a version (JSON and its packfile twin)
+DATA_EXTENSIONS = (".json", ".pack")
+
+# Versions kept on disk for rollback, besides the live one
+KEEP_VERSIONS = 10
+
+def fsync_dir(path):
+    """Make a rename or new entry in `path` durable (a no-op where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def atomic_write(path, write, mode=None):
+    """Write a file via `write(f)` so that `path` is either the old or the whole new file.
+
+    The data goes to a temp file beside `path`, is fsynced, and is renamed
+    over `path`; the directory is then fsynced so the rename survives a crash.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    mode = mode or ("wb" if path.endswith(".pack") else "w")
+    encoding = None if "b" in mode else "utf-8"
+    try:
+        with open(temp_path, mode, encoding=encoding) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    fsync_dir(os.path.dirname(os.path.abspath(path)))
+
+def _new_version_name():
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+def _link_or_copy(source, target):
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+class SnapshotStore:
+    """The versioned data files under one data dir."""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.snapshots_dir = os.path.join(data_dir, SNAPSHOTS_DIR)
+
+    def current_version(self):
+        """Name of the live version, or None before the first publish."""
+        try:
+            with open(os.path.join(self.data_dir, POINTER), "r", encoding="utf-8") as f:
+                version = f.read().strip()
+        except OSError:
+            return None
+        return version if version and os.path.isdir(os.path.join(self.snapshots_dir, version)) else None
+
+    def version_dir(self, version):
+        return os.path.join(self.snapshots_dir, version) if version else self.data_dir
+
+    def current_dir(self):
+        """Directory holding the live files; resolve it once per consistent read."""
+        return self.version_dir(self.current_version())
+
+    def resolve(self, filename):
+        return os.path.join(self.current_dir(), filename)
+
+    def versions(self):
+        """Published versions, oldest first."""
+        if not os.path.isdir(self.snapshots_dir):
+            return []
+        return sorted(name for name in os.listdir(self.snapshots_dir)
+                      if os.path.isdir(os.path.join(self.snapshots_dir, name)) and not name.endswith(".tmp"))
+
+    def manifest(self, version):
+        try:
+            with open(os.path.join(self.version_dir(version), MANIFEST), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def publish(self, writers, info=None):
+        """Publish a new version and make it live; returns its name.
+
+        `writers` maps filename -> write(f) for the files that changed;
+        every other file of the live version is carried over by hard link.
+        The version is assembled under a temp name and renamed into place,
+        so a crash mid-publish leaves the live version untouched.
+        """
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        base = self.current_dir()
+        base_version = self.current_version()
+        version = _new_version_name()
+        building = os.path.join(self.snapshots_dir, version + ".tmp")
+        os.makedirs(building)
+        try:
+            for filename, write in writers.items():
+                atomic_write(os.path.join(building, filename), write)
+            carried = []
+            if os.path.isdir(base):
+                for filename in os.listdir(base):
+                    source = os.path.join(base, filename)
+                    if (filename.endswith(DATA_EXTENSIONS) and filename not in writers and filename != MANIFEST
+                            and os.path.isfile(source)):
+                        _link_or_copy(source, os.path.join(building, filename))
+                        carried.append(filename)
+            atomic_write(os.path.join(building, MANIFEST), lambda f: json.dump({
+                "version": version,
+                "parent": base_version,
+                "written": sorted(writers),
+                "carried": sorted(carried),
+                **(info or {}),
+            }, f, indent=4))
+            fsync_dir(building)
+            os.rename(building, os.path.join(self.snapshots_dir, version))
+            fsync_dir(self.snapshots_dir)
+        except BaseException:
+            shutil.rmtree(building, ignore_errors=True)
+            raise
+        self.activate(version)
+        self.prune()
+        return version
+
+    def activate(self, version):
+        """Point `current` at an existing version."""
+        if not os.path.isdir(os.path.join(self.snapshots_dir, version)):
+            raise ValueError(f"No such version: {version}")
+        atomic_write(os.path.join(self.data_dir, POINTER), lambda f: f.write(version + "\n"))
+
+    def rollback(self, version=None):
+        """Make `version` (default: the one before the live one) live again; returns it."""
+        if version is None:
+            versions = self.versions()
+            current = self.current_version()
+            older = [v for v in versions if current is None or v < current]
+            if not older:
+                raise ValueError("No earlier version to roll back to")
+            version = older[-1]
+        self.activate(version)
+        return version
+
+    def prune(self, keep=KEEP_VERSIONS):
+        """Delete all but the newest `keep` versions, never the live one."""
+        current = self.current_version()
+        for version in self.versions()[:-keep or None]:
+            if version != current:
+                shutil.rmtree(os.path.join(self.snapshots_dir, version), ignore_errors=True)
@@ -0,0 +1,222 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# SQLite article store shared by the scrapers (writers) and the API (reader)
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "azernews.db")
+
+# Paragraphs are stored as one text column so FTS5 can index them;
+# U+2029 never occurs inside a paragraph and tokenizes as whitespace.
+PARAGRAPH_SEP = "\u2029"
+
+FIELDS = ("title", "link", "thumbnail", "summary", "author", "author_img", "publish_date", "content")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    link TEXT NOT NULL,
+    title TEXT,
+    thumbnail TEXT,
+    summary TEXT,
+    author TEXT,
+    author_img TEXT,
+    publish_date TEXT,
+    published_at TEXT,
+    content TEXT,
+    UNIQUE (category, link)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (category, position);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_link ON articles (link);
+CREATE INDEX IF NOT EXISTS idx_articles_author ON articles (author);
+
+-- Which data file each category was last synced from (see source_of)
+CREATE TABLE IF NOT EXISTS synced (
+    category TEXT PRIMARY KEY,
+    source TEXT NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    title, summary, content, content='articles', content_rowid='id',
+    tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, summary, content)
+    VALUES (new.id, new.title, new.summary, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary, content)
+    VALUES ('delete', old.id, old.title, old.summary, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary, content)
+    VALUES ('delete', old.id, old.title, old.summary, old.content);
+    INSERT INTO articles_fts (rowid, title, summary, content)
+    VALUES (new.id, new.title, new.summary, new.content);
+END;
+"""
+
+def parse_publish_date(publish_date):
+    """'21 July 2025 09:45 (UTC+04:00)' -> '2025-07-21T09:45:00+04:00' (None if unparseable)."""
+    if not publish_date:
+        return None
+    try:
+        stamp, _, zone = publish_date.partition(" (UTC")
+        parsed = datetime.strptime(stamp.strip(), "%d %B %Y %H:%M")
+    except ValueError:
+        return None
+    offset = zone.rstrip(")") or "+00:00"
+    return parsed.isoformat() + offset
+
+def source_of(path):
+    """Identifies a data file's contents: its mtime, which the hard links that
+    carry an unchanged file into later data versions keep (None if missing)."""
+    try:
+        return str(os.stat(path).st_mtime_ns)
+    except OSError:
+        return None
+
+def fts_query(text):
+    """Quote every term so user input can never be read as FTS5 syntax."""
+    return " ".join('"%s"' % term.replace('"', '""') for term in text.split())
+
+def _row_to_article(row):
+    article = {field: row[field] for field in FIELDS if field != "content"}
+    article["content"] = row["content"].split(PARAGRAPH_SEP) if row["content"] else []
+    if article["summary"] is None:
+        del article["summary"]
+    return article
+
+class ArticleStore:
+    """Articles indexed by category, publish date, link and author, plus FTS5."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def save_category(self, category, articles):
+        """Insert or update a category's articles, keeping the given order."""
+        with self._connect() as conn:
+            self._upsert(conn, category, articles)
+
+    def sync_category(self, category, articles, source):
+        """Make the store hold exactly `articles` for the category, synced from `source`.
+
+        Unlike save_category, articles no longer in the list are removed,
+        so rolling back to an older data version drops the newer articles.
+        """
+        with self._connect() as conn:
+            links = self._upsert(conn, category, articles)
+            stored = {row["link"] for row in conn.execute("SELECT link FROM articles WHERE category = ?", (category,))}
+            conn.executemany("DELETE FROM articles WHERE category = ? AND link = ?",
+                             [(category, link) for link in stored - links])
+            conn.execute("INSERT INTO synced (category, source) VALUES (?, ?) "
+                         "ON CONFLICT (category) DO UPDATE SET source = excluded.source", (category, source))
+
+    def synced_source(self, category):
+        """The source the category was last synced from (None if never)."""
+        row = self._connect().execute("SELECT source FROM synced WHERE category = ?", (category,)).fetchone()
+        return row["source"] if row else None
+
+    def _upsert(self, conn, category, articles):
+        """Upsert the articles in `conn`'s transaction; returns their links."""
+        rows = [(
+            category, position, article["link"], article.get("title"), article.get("thumbnail"),
+            article.get("summary"), article.get("author"), article.get("author_img"),
+            article.get("publish_date"), parse_publish_date(article.get("publish_date")),
+            PARAGRAPH_SEP.join(article.get("content") or []),
+        ) for position, article in enumerate(articles) if article.get("link")]
+
+        conn.executemany("""
+            INSERT INTO articles (category, position, link, title, thumbnail, summary,
+                                  author, author_img, publish_date, published_at, content)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (category, link) DO UPDATE SET
+                position = excluded.position, title = excluded.title,
+                thumbnail = excluded.thumbnail, summary = excluded.summary,
+                author = excluded.author, author_img = excluded.author_img,
+                publish_date = excluded.publish_date, published_at = excluded.published_at,
+                content = excluded.content
+            WHERE (title, thumbnail, summary, author, author_img, publish_date, content, position)
+                  IS NOT (excluded.title, excluded.thumbnail, excluded.summary, excluded.author,
+                          excluded.author_img, excluded.publish_date, excluded.content, excluded.position)
+        """, rows)
+        return {row[2] for row in rows}
+
+    def category_articles(self, category, author=None, limit=-1, offset=0):
+        query = "SELECT * FROM articles WHERE category = ?"
+        params = [category]
+        if author:
+            query += " AND author = ?"
+            params.append(author)
+        query += " ORDER BY position LIMIT ? OFFSET ?"
+        rows = self._connect().execute(query, params + [limit, offset]).fetchall()
+        return [_row_to_article(row) for row in rows]
+
+    def categories(self):
+        rows = self._connect().execute("SELECT DISTINCT category FROM articles").fetchall()
+        return [row["category"] for row in rows]
+
+    def by_link(self, link):
+        row = self._connect().execute(
+            "SELECT * FROM articles WHERE link = ? LIMIT 1", (link,)).fetchone()
+        return _row_to_article(row) if row else None
+
+    def latest(self, limit=20, offset=0):
+        rows = self._connect().execute(
+            "SELECT * FROM articles ORDER BY published_at DESC LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+        return [_row_to_article(row) for row in rows]
+
+    def search(self, query, category=None, limit=20):
+        """Full-text search over title, summary and content, best match first.
+
+        Ranked by BM25 with title and summary hits weighted above body
+        hits. An article stored under several categories is returned once,
+        with all of its categories.
+        """
+        if not query.split():
+            return []
+        sql = """
+            SELECT articles.*, bm25(articles_fts, 10.0, 4.0, 1.0) AS score,
+                   snippet(articles_fts, 2, '<mark>', '</mark>', '…', 24) AS snippet
+            FROM articles_fts JOIN articles ON articles.id = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+        """
+        params = [fts_query(query)]
+        if category:
+            sql += " AND articles.category = ?"
+            params.append(category)
+        sql += " ORDER BY score LIMIT ?"
+        rows = self._connect().execute(sql, params + [limit * 3]).fetchall()
+
+        results = {}
+        for row in rows:
+            found = results.get(row["link"])
+            if found:
+                found["categories"].append(row["category"])
+                continue
+            if len(results) == limit:
+                continue
+            article = _row_to_article(row)
+            article["category"] = row["category"]
+            article["categories"] = [row["category"]]
+            article["snippet"] = row["snippet"]
+            article["score"] = round(-row["score"], 4)
+            results[row["link"]] = article
+        return list(results.values())
@@ -4,20 +4,26 @@ import { Article } from '../../utils/api';
 import NewsCard from './NewsCard';
 import LoadingSpinner from '../common/LoadingSpinner';
 import { useNavigate } from 'react-router-dom';
-import { generateArticleId } from '../../utils/helpers';
+import { generateArticleId, getPreview } from '../../utils/helpers';
 
 interface FeaturedNewsProps {
   articles: Article[] | null;
   loading: boolean;
   error: string | null;
   selectedCategory: string;
+  hasMore?: boolean;
+  loadingMore?: boolean;
+  onLoadMore?: () => void;
 }
 
 const FeaturedNews: React.FC<FeaturedNewsProps> = ({
   articles,
   loading,
   error,
-  selectedCategory
+  selectedCategory,
+  hasMore = false,
+  loadingMore = false,
+  onLoadMore
 }) => {
   const navigate = useNavigate();
 
@@ -121,7 +127,7 @@ const FeaturedNews: React.FC<FeaturedNewsProps> = ({
                 {safeArticles[0].title}
               </h3>
               <p className="text-gray-600 mb-6 text-lg leading-relaxed">
-                {safeArticles[0].content?.[0]?.substring(0, 200) || 'No preview available'}...
+                {getPreview(safeArticles[0]).substring(0, 200) || 'No preview available'}...
               </p>
               <div className="flex items-center space-x-4 mb-6">
                 <img
@@ -168,7 +174,7 @@ const FeaturedNews: React.FC<FeaturedNewsProps> = ({
           transition={{ duration: 0.6, delay: 0.3 }}
           className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8"
         >
-          {safeArticles.slice(1, 13).map((article, index) => (
+          {safeArticles.slice(1).map((article, index) => (
             <motion.div
               key={`${article.title}-${index}`}
               initial={{ opacity: 0, y: 50 }}
@@ -186,7 +192,7 @@ const FeaturedNews: React.FC<FeaturedNewsProps> = ({
         </motion.div>
 
         {/* Load More */}
-        {safeArticles.length > 13 && (
+        {hasMore && onLoadMore && (
           <motion.div
             initial={{ opacity: 0, y: 20 }}
             animate={{ opacity: 1, y: 0 }}
@@ -196,9 +202,11 @@ const FeaturedNews: React.FC<FeaturedNewsProps> = ({
             <motion.button
               whileHover={{ scale: 1.05 }}
               whileTap={{ scale: 0.95 }}
-              className="bg-gray-800 text-white px-8 py-3 rounded-lg font-semibold hover:bg-gray-900 transition-colors shadow-lg"
+              onClick={onLoadMore}
+              disabled={loadingMore}
+              className="bg-gray-800 text-white px-8 py-3 rounded-lg font-semibold hover:bg-gray-900 transition-colors shadow-lg disabled:opacity-60"
             >
-              Load More Articles
+              {loadingMore ? 'Loading...' : 'Load More Articles'}
             </motion.button>
           </motion.div>
         )}
@@ -2,7 +2,7 @@ import React from 'react';
 import { motion } from 'framer-motion';
 import { Clock, User, ExternalLink } from 'lucide-react';
 import { Article } from '../../utils/api';
-import { formatDate, truncateText, getImageWithFallback, calculateReadingTime } from '../../utils/helpers';
+import { formatDate, truncateText, getImageWithFallback, getPreview, getReadingTime } from '../../utils/helpers';
 
 interface NewsCardProps {
   article: Article;
@@ -17,9 +17,10 @@ const NewsCard: React.FC<NewsCardProps> = ({
   showCategory = false,
   category
 }) => {
-  const readingTime = calculateReadingTime(article.content);
-  const previewText = article.content.length > 0 
-    ? truncateText(article.content[0], 120)
+  const readingTime = getReadingTime(article);
+  const preview = getPreview(article);
+  const previewText = preview
+    ? truncateText(preview, 120)
     : 'No preview available';
 
   return (
@@ -1,36 +1,69 @@
-import { useState, useEffect, useMemo } from 'react';
-import { api, Article } from '../utils/api';
+import { useState, useEffect, useMemo, useCallback } from 'react';
+import { api, Article, ArticlePage, PAGE_SIZE } from '../utils/api';
 import { useApi } from './useApi';
 
-export const useNews = (category?: string) => {
-  const apiCall = useMemo(() => {
+// Cards for a category (or all), fetched a page at a time; loadMore appends the next page
+export const useNews = (category?: string, firstPage = PAGE_SIZE) => {
+  const fetchPage = useMemo(() => {
     return category && category !== 'all'
-      ? () => api.getArticlesByCategory(category)
-      : () => api.getAllArticles();
+      ? (offset: number, limit: number) => api.getArticlesByCategory(category, offset, limit)
+      : (offset: number, limit: number) => api.getAllArticles(offset, limit);
   }, [category]);
 
-  return useApi<Article[]>(apiCall, [category]);
+  const { data, loading, error, refetch } = useApi<ArticlePage>(() => fetchPage(0, firstPage), [category]);
+  const [more, setMore] = useState<Article[]>([]);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  useEffect(() => {
+    setMore([]);
+  }, [data]);
+
+  const articles = useMemo(() => (data ? [...data.articles, ...more] : null), [data, more]);
+  const hasMore = !!data && !!articles && articles.length < data.total;
+
+  const loadMore = useCallback(async () => {
+    if (!articles || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const next = await fetchPage(articles.length, PAGE_SIZE);
+      setMore(prev => [...prev, ...next.articles]);
+    } catch {
+      // The button stays, so the user can try again
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [articles, fetchPage, loadingMore]);
+
+  return { data: articles, loading, error, refetch, hasMore, loadMore, loadingMore };
 };
 
-export const useSearchNews = (articles: Article[], searchTerm: string) => {
+export const useSearchNews = (articles: Article[], searchTerm: string, category?: string) => {
   const [filteredArticles, setFilteredArticles] = useState<Article[]>(articles);
 
   useEffect(() => {
-    if (!searchTerm.trim()) {
+    const term = searchTerm.trim();
+    if (!term) {
       setFilteredArticles(articles);
       return;
     }
 
-    const filtered = articles.filter((article) =>
-      article.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      article.author.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      article.content.some(paragraph => 
-        paragraph.toLowerCase().includes(searchTerm.toLowerCase())
-      )
-    );
+    // Ranked search runs on the server; debounce so each keystroke isn't a request
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      api.searchArticles(term, category && category !== 'all' ? category : undefined)
+        .then((results) => {
+          if (!cancelled) setFilteredArticles(results);
+        })
+        .catch(() => {
+          if (!cancelled) setFilteredArticles([]);
+        });
+    }, 250);
 
-    setFilteredArticles(filtered);
-  }, [articles, searchTerm]);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [articles, searchTerm, category]);
 
   return filteredArticles;
 };
\ No newline at end of file
@@ -15,8 +15,8 @@ const CategoryNews: React.FC = () => {
   const [searchTerm, setSearchTerm] = useState('');
   const [sortBy, setSortBy] = useState<'date' | 'title'>('date');
 
-  const { data: articles, loading, error } = useNews(categoryName);
-  const filteredArticles = useSearchNews(articles || [], searchTerm);
+  const { data: articles, loading, error, hasMore, loadMore, loadingMore } = useNews(categoryName);
+  const filteredArticles = useSearchNews(articles || [], searchTerm, categoryName);
 
   // Sort articles
   const sortedArticles = [...filteredArticles].sort((a, b) => {
@@ -209,6 +209,19 @@ const CategoryNews: React.FC = () => {
             ))}
           </motion.div>
         )}
+
+        {/* Load More */}
+        {hasMore && !searchTerm && (
+          <div className="text-center mt-12">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="bg-gray-800 text-white px-8 py-3 rounded-lg font-semibold hover:bg-gray-900 transition-colors shadow-lg disabled:opacity-60"
+            >
+              {loadingMore ? 'Loading...' : 'Load More Articles'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -4,16 +4,19 @@ import HeroSection from '../components/home/HeroSection';
 import CategorySelector from '../components/home/CategorySelector';
 import FeaturedNews from '../components/home/FeaturedNews';
 import { useNews, useSearchNews } from '../hooks/useNews';
+import { PAGE_SIZE } from '../utils/api';
 
 const Home: React.FC = () => {
   const [selectedCategory, setSelectedCategory] = useState('all');
   const [searchTerm, setSearchTerm] = useState('');
   
-  const { data: articles, loading, error, refetch } = useNews(
-    selectedCategory === 'all' ? undefined : selectedCategory
+  // The featured story plus a full grid
+  const { data: articles, loading, error, hasMore, loadMore, loadingMore } = useNews(
+    selectedCategory === 'all' ? undefined : selectedCategory,
+    PAGE_SIZE + 1
   );
   
-  const filteredArticles = useSearchNews(articles || [], searchTerm);
+  const filteredArticles = useSearchNews(articles || [], searchTerm, selectedCategory);
 
   const handleCategoryChange = (category: string) => {
     setSelectedCategory(category);
@@ -57,6 +60,9 @@ const Home: React.FC = () => {
         loading={loading}
         error={error}
         selectedCategory={selectedCategory}
+        hasMore={hasMore && !searchTerm}
+        loadingMore={loadingMore}
+        onLoadMore={loadMore}
       />
 
       {/* Search Results Info */}
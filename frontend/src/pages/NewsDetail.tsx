@@ -2,14 +2,34 @@ import React from 'react';
 import { useParams, useLocation, Link } from 'react-router-dom';
 import { motion } from 'framer-motion';
 import { ChevronRight, Clock, User, Calendar, Share2, ArrowLeft, ExternalLink } from 'lucide-react';
-import { formatDate, getImageWithFallback, calculateReadingTime } from '../utils/helpers';
-import { Article } from '../utils/api';
+import { formatDate, getImageWithFallback, getReadingTime } from '../utils/helpers';
+import { api, Article } from '../utils/api';
+import { useApi } from '../hooks/useApi';
 import Button3D from '../components/common/Button3D';
+import LoadingSpinner from '../components/common/LoadingSpinner';
 
 const NewsDetail: React.FC = () => {
   const { id } = useParams<{ id: string }>();
   const location = useLocation();
-  const article = location.state?.article as Article;
+  const stateArticle = location.state?.article as Article | undefined;
+
+  // Cards from list pages carry no content, and direct links and reloads have
+  // no router state at all, so fetch the full article by ID unless we have it
+  const hasContent = !!stateArticle?.content;
+  const { data: fetchedArticle, loading } = useApi<Article | null>(
+    () => (hasContent || !id ? Promise.resolve(stateArticle ?? null) : api.getArticle(id)),
+    [id]
+  );
+  const fullArticle = hasContent ? stateArticle : fetchedArticle;
+  const article = fullArticle ?? stateArticle;
+
+  if (!fullArticle && loading) {
+    return (
+      <div className="min-h-screen bg-gray-50 flex items-center justify-center">
+        <LoadingSpinner size="lg" />
+      </div>
+    );
+  }
 
   if (!article) {
     return (
@@ -38,14 +58,15 @@ const NewsDetail: React.FC = () => {
     );
   }
 
-  const readingTime = calculateReadingTime(article.content);
+  const readingTime = getReadingTime(article);
+  const content = article.content || [];
 
   const handleShare = async () => {
     if (navigator.share) {
       try {
         await navigator.share({
           title: article.title,
-          text: article.content[0]?.substring(0, 100) + '...',
+          text: (content[0] ?? article.preview ?? '').substring(0, 100) + '...',
           url: window.location.href,
         });
       } catch (err) {
@@ -187,7 +208,7 @@ const NewsDetail: React.FC = () => {
           className="bg-white rounded-2xl shadow-lg p-8 mb-8"
         >
           <div className="prose prose-lg max-w-none">
-            {article.content.map((paragraph, index) => (
+            {content.map((paragraph, index) => (
               <motion.p
                 key={index}
                 initial={{ opacity: 0, y: 20 }}
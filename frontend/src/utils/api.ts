@@ -1,5 +1,6 @@
 import axios from 'axios';
 import { mockArticles, mockCategorizedArticles } from './mockData';
+import { generateArticleId } from './helpers';
 
 // Use .env value or fallback to localhost:5000
 const API_BASE_URL =  'http://127.0.0.1:5000';
@@ -26,13 +27,19 @@ apiClient.interceptors.response.use(
 );
 
 export interface Article {
+  id?: string;
+  categories?: string[];
   title: string;
   link: string;
   thumbnail: string;
   author: string;
   author_img: string;
   publish_date: string;
-  content: string[];
+  // Absent from list pages (see CARD_FIELDS); fetch the article by ID for it
+  content?: string[];
+  // Computed by the API for list pages: start of the first paragraph, word count
+  preview?: string;
+  words?: number;
 }
 
 export interface ApiResponse {
@@ -40,37 +47,100 @@ export interface ApiResponse {
   error?: string;
 }
 
+// One page of a list plus how many articles the list has in all
+export interface ArticlePage {
+  articles: Article[];
+  total: number;
+}
+
+// Cards per list request
+export const PAGE_SIZE = 12;
+
+// What a news card shows; lists never carry the full content
+const CARD_FIELDS = 'title,link,thumbnail,summary,author,author_img,publish_date,categories,preview,words';
+
+const mockPage = (articles: Article[], offset: number, limit: number): ArticlePage => ({
+  articles: articles.slice(offset, offset + limit),
+  total: articles.length,
+});
+
+const getPage = async (url: string, params: Record<string, unknown>, offset: number, limit: number): Promise<ArticlePage> => {
+  const response = await apiClient.get<Article[]>(url, {
+    params: { ...params, limit, offset, fields: CARD_FIELDS },
+  });
+  const total = Number(response.headers['x-total-count']);
+  return {
+    articles: response.data,
+    total: Number.isNaN(total) ? offset + response.data.length : total,
+  };
+};
+
 export const api = {
-  getAllArticles: async (): Promise<Article[]> => {
+  getAllArticles: async (offset = 0, limit = PAGE_SIZE): Promise<ArticlePage> => {
     if (USE_MOCK_DATA) {
       await new Promise(resolve => setTimeout(resolve, 500));
-      return mockArticles;
+      return mockPage(mockArticles, offset, limit);
     }
 
     try {
-      const response = await apiClient.get<Article[]>('/api/articles');
-      return response.data;
+      return await getPage('/api/articles', { unique: 1 }, offset, limit);
     } catch (error) {
       console.error('Error fetching all articles:', error);
       throw error;
     }
   },
 
-  getArticlesByCategory: async (category: string): Promise<Article[]> => {
+  getArticlesByCategory: async (category: string, offset = 0, limit = PAGE_SIZE): Promise<ArticlePage> => {
     if (USE_MOCK_DATA) {
       await new Promise(resolve => setTimeout(resolve, 300));
-      return mockCategorizedArticles[category as keyof typeof mockCategorizedArticles] || [];
+      return mockPage(mockCategorizedArticles[category as keyof typeof mockCategorizedArticles] || [], offset, limit);
     }
 
     try {
-      const response = await apiClient.get<Article[]>(`/api/articles/${category}`);
-      return response.data;
+      return await getPage(`/api/articles/${category}`, {}, offset, limit);
     } catch (error) {
       console.error(`Error fetching articles for category ${category}:`, error);
       throw error;
     }
   },
 
+  getArticle: async (id: string): Promise<Article> => {
+    if (USE_MOCK_DATA) {
+      await new Promise(resolve => setTimeout(resolve, 300));
+      const article = (mockArticles as Article[]).find(a => generateArticleId(a) === id);
+      if (!article) throw new Error(`Article ${id} not found`);
+      return article;
+    }
+
+    try {
+      const response = await apiClient.get<Article>(`/api/article/${id}`);
+      return response.data;
+    } catch (error) {
+      console.error(`Error fetching article ${id}:`, error);
+      throw error;
+    }
+  },
+
+  searchArticles: async (query: string, category?: string): Promise<Article[]> => {
+    if (USE_MOCK_DATA) {
+      const term = query.toLowerCase();
+      return (mockArticles as Article[]).filter((article) =>
+        article.title.toLowerCase().includes(term) ||
+        (article.content || []).some(paragraph => paragraph.toLowerCase().includes(term))
+      );
+    }
+
+    try {
+      const response = await apiClient.get<Article[]>('/api/search', {
+        params: { q: query, category },
+      });
+      return response.data;
+    } catch (error) {
+      console.error(`Error searching articles for "${query}":`, error);
+      throw error;
+    }
+  },
+
   healthCheck: async (): Promise<boolean> => {
     if (USE_MOCK_DATA) {
       return true;
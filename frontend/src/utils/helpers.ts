@@ -21,7 +21,9 @@ export const formatDate = (dateString: string): string => {
   }
 };
 
-export const generateArticleId = (article: { title: string; link: string }): string => {
+export const generateArticleId = (article: { id?: string; title: string; link: string }): string => {
+  // Prefer the stable ID from the API so /news/:id can be fetched directly
+  if (article.id) return article.id;
   // Create a unique ID from title and link
   return btoa(encodeURIComponent(article.title + article.link))
     .replace(/[^a-zA-Z0-9]/g, '')
@@ -36,10 +38,21 @@ export const getImageWithFallback = (imageSrc: string): string => {
   return imageSrc;
 };
 
+const WORDS_PER_MINUTE = 200;
+
 export const calculateReadingTime = (content: string[]): number => {
-  const wordsPerMinute = 200;
   const totalWords = content.join(' ').split(' ').length;
-  return Math.ceil(totalWords / wordsPerMinute);
+  return Math.ceil(totalWords / WORDS_PER_MINUTE);
+};
+
+// List pages carry a word count and a preview instead of the content
+export const getReadingTime = (article: { words?: number; content?: string[] }): number => {
+  if (article.words !== undefined) return Math.max(1, Math.ceil(article.words / WORDS_PER_MINUTE));
+  return calculateReadingTime(article.content || []);
+};
+
+export const getPreview = (article: { preview?: string; content?: string[] }): string => {
+  return article.preview ?? article.content?.[0] ?? '';
 };
 
 export const debounce = <T extends (...args: any[]) => any>(